@@ -0,0 +1 @@
+"""Benchmark suite and synthetic input generators for the calendar days"""
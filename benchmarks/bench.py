@@ -0,0 +1,183 @@
+"""
+Benchmarks every day over generated inputs of increasing size, recording time and peak memory per phase
+
+Each run appends one JSON object per (day, size) to the results file, tagged with the current git commit, so scaling
+curves can be compared across commits.
+
+Usage (from the repo root):
+    python -m benchmarks.bench                                   # every day at 10^3, 10^4 and 10^5
+    python -m benchmarks.bench --days 5 --sizes 1000 1000000 --repeat 3
+    python -m benchmarks.bench --days 7 --option max_depth=5000 --option max_fanout=1
+    python -m benchmarks.bench --preset deep-tree --sizes 100000
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import time
+import tracemalloc
+from calendar.runner import discover_days, load_day
+from typing import Callable, Dict, List, Optional
+
+from .generators import GENERATORS, PRESETS, parse_options, write_input
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+PHASES = ("load", "parse", "part1", "part2")
+
+
+def generated_input(day: int, size: int, data_dir: str, seed: int = 2022, options: Dict[str, int] = None) -> str:
+    """Returns the location of a generated input, only writing it out if it does not already exist"""
+    options = options or {}
+    os.makedirs(data_dir, exist_ok=True)
+    option_tags = "".join(f"_{name}-{value}" for name, value in sorted(options.items()))
+    input_location = os.path.join(data_dir, f"day{day}_{size}_{seed}{option_tags}.txt")
+    if not os.path.exists(input_location):
+        write_input(day, size, input_location, seed, **options)
+
+    return input_location
+
+
+def _phase_steps(day: int, input_location: str, engine: str = None) -> List[Callable[[], None]]:
+    """The work done in each phase, in order, sharing one solver instance between them"""
+    # Imported up front so module import time is not counted as part of loading the input
+    solver_class = load_day(day)
+    state = {}
+
+    def load() -> None:
+        state["solver"] = solver_class.from_path(input_location)
+        if engine is not None:
+            state["solver"].engine = state["solver"]._select_engine(engine)
+
+    return [
+        load,
+        lambda: state["solver"].parsed,
+        lambda: state["solver"].solve_part1(),
+        lambda: state["solver"].solve_part2(),
+    ]
+
+
+def time_phases(day: int, input_location: str, engine: str = None) -> Dict[str, float]:
+    """Wall time of each phase, measured without any memory tracing overhead"""
+    seconds = {}
+    for phase, step in zip(PHASES, _phase_steps(day, input_location, engine)):
+        start = time.perf_counter()
+        step()
+        seconds[phase] = time.perf_counter() - start
+
+    return seconds
+
+
+def trace_phases(day: int, input_location: str, engine: str = None) -> Dict[str, int]:
+    """Peak traced memory of each phase, in bytes"""
+    peak_bytes = {}
+    tracemalloc.start()
+    try:
+        for phase, step in zip(PHASES, _phase_steps(day, input_location, engine)):
+            tracemalloc.reset_peak()
+            step()
+            peak_bytes[phase] = tracemalloc.get_traced_memory()[1]
+
+    finally:
+        tracemalloc.stop()
+
+    return peak_bytes
+
+
+def benchmark(
+    day: int,
+    size: int,
+    data_dir: str,
+    repeat: int = 1,
+    trace_memory: bool = True,
+    engine: str = None,
+    options: Optional[Dict[str, int]] = None,
+) -> dict:
+    """
+    Benchmarks one day at one input size, keeping the fastest of the repeated runs for each phase
+
+    options are passed on to the day's input generator, eg max_depth for day 7.
+    """
+    input_location = generated_input(day, size, data_dir, options=options)
+    result = {
+        "day": day,
+        "size": size,
+        "input_bytes": os.path.getsize(input_location),
+        "engine": engine,
+        "options": options or {},
+        "phases": {},
+    }
+    try:
+        runs = [time_phases(day, input_location, engine) for _ in range(repeat)]
+        peak_bytes = trace_phases(day, input_location, engine) if trace_memory else {}
+
+    except Exception as e:
+        result["error"] = f"{e.__class__.__name__}: {e}"
+        return result
+
+    for phase in PHASES:
+        result["phases"][phase] = {"seconds": min(run[phase] for run in runs), "peak_bytes": peak_bytes.get(phase)}
+
+    return result
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True, cwd=BENCHMARKS_DIR
+        ).stdout.strip()
+
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _format_result(result: dict) -> str:
+    if "error" in result:
+        return f"Day {result['day']:>2} | {result['size']:>11,} | ERROR {result['error']}"
+
+    phases = " | ".join(
+        f"{phase} {timing['seconds']:.4f}s"
+        + (f" {timing['peak_bytes'] / 1024 / 1024:.1f}MiB" if timing["peak_bytes"] is not None else "")
+        for phase, timing in result["phases"].items()
+    )
+    return f"Day {result['day']:>2} | {result['size']:>11,} | {phases}"
+
+
+def main(argv: List[str] = None) -> None:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--days", type=int, nargs="+", default=sorted(set(discover_days()) & set(GENERATORS)))
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=1, help="Timing runs per input, the fastest is recorded")
+    parser.add_argument("--no-memory", dest="trace_memory", action="store_false", help="Skip the tracemalloc pass")
+    parser.add_argument("--engine", help="Engine to solve with where a day has it, eg numpy")
+    parser.add_argument("--data-dir", default=os.path.join(BENCHMARKS_DIR, "data"), help="Where inputs are generated")
+    parser.add_argument("--results", default=os.path.join(BENCHMARKS_DIR, "results.jsonl"), help="File to append to")
+    parser.add_argument("--option", action="append", default=[], help="Input generator option as NAME=VALUE")
+    parser.add_argument("--preset", choices=sorted(PRESETS), help="Named generator settings, benchmarks their day")
+    args = parser.parse_args(argv)
+
+    options = {}
+    if args.preset is not None:
+        preset_day, options = PRESETS[args.preset]
+        args.days = [preset_day]
+
+    options = {**options, **parse_options(args.option)}
+
+    run_details = {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+    }
+    with open(args.results, "a") as results_file:
+        for day in args.days:
+            for size in args.sizes:
+                result = benchmark(day, size, args.data_dir, args.repeat, args.trace_memory, args.engine, options)
+                print(_format_result(result))
+                results_file.write(json.dumps({**run_details, **result}) + "\n")
+                results_file.flush()
+
+
+if __name__ == "__main__":
+    main()
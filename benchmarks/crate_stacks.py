@@ -0,0 +1,101 @@
+"""
+Benchmarks day 5's rope-backed crate stacks against plain list stacks, on far bigger stacks and moves than the puzzle's
+
+The same random move program is run on both, once per crane, and the top crates are checked to agree.
+
+Usage (from the repo root):
+    python -m benchmarks.crate_stacks                            # 9 stacks of 10^5 and 10^6 crates
+    python -m benchmarks.crate_stacks --heights 1000000 --moves 2000 --max-quantity 500000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from calendar.runner import discover_days
+from typing import Callable, Dict, List, Tuple
+
+Program = List[Tuple[int, int, int]]
+
+
+def move_program(num_stacks: int, height: int, moves: int, max_quantity: int, seed: int = 2022) -> Program:
+    """Random moves that never try to take more crates than a stack holds"""
+    rng = random.Random(seed)
+    heights = [height] * num_stacks
+    program = []
+    for _ in range(moves):
+        origin_stack, dest_stack = rng.sample(range(num_stacks), 2)
+        quantity = rng.randint(0, min(max_quantity, heights[origin_stack]))
+        heights[origin_stack] -= quantity
+        heights[dest_stack] += quantity
+        program.append((quantity, origin_stack, dest_stack))
+
+    return program
+
+
+def run_lists(stacks: List[list], program: Program, reverse: bool) -> List[str]:
+    """The list stacks, moved the same way as SupplyStacks.run_cranes"""
+    for quantity, origin_stack, dest_stack in program:
+        origin = stacks[origin_stack]
+        split = max(len(origin) - quantity, 0)
+        stacks[dest_stack].extend(reversed(origin[split:]) if reverse else origin[split:])
+        del origin[split:]
+
+    return [stack[-1] if len(stack) else None for stack in stacks]
+
+
+def run_ropes(stacks: list, program: Program, reverse: bool) -> List[str]:
+    """The CrateStack stacks"""
+    for quantity, origin_stack, dest_stack in program:
+        stacks[origin_stack].move_to(stacks[dest_stack], quantity, reverse)
+
+    return [stack[-1] if len(stack) else None for stack in stacks]
+
+
+def time_run(run: Callable, stacks: list, program: Program, reverse: bool) -> Tuple[float, List[str]]:
+    """Wall time of one run over the program, and the top crates it left"""
+    start = time.perf_counter()
+    tops = run(stacks, program, reverse)
+    return time.perf_counter() - start, tops
+
+
+def benchmark(num_stacks: int, height: int, moves: int, max_quantity: int) -> Dict[str, float]:
+    """Seconds taken by each stack type with each crane"""
+    # The day's directory has to be importable for its private modules, as it is when the day itself runs
+    sys.path.insert(0, os.path.dirname(discover_days()[5]))
+    from _crate_rope import CrateStack
+
+    program = move_program(num_stacks, height, moves, max_quantity)
+    starting_stacks = [[f"[{stack_num}:{level}]" for level in range(height)] for stack_num in range(num_stacks)]
+    seconds = {}
+    for crane, reverse in (("9000", True), ("9001", False)):
+        list_seconds, list_tops = time_run(run_lists, [list(stack) for stack in starting_stacks], program, reverse)
+        rope_seconds, rope_tops = time_run(run_ropes, list(map(CrateStack, starting_stacks)), program, reverse)
+        if list_tops != rope_tops:
+            raise AssertionError(f"CrateMover {crane}: list stacks gave {list_tops}, rope stacks gave {rope_tops}")
+
+        seconds[f"list_{crane}"] = list_seconds
+        seconds[f"rope_{crane}"] = rope_seconds
+
+    return seconds
+
+
+def main(argv: List[str] = None) -> None:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.crate_stacks", description=__doc__.strip().splitlines()[0]
+    )
+    parser.add_argument("--stacks", type=int, default=9)
+    parser.add_argument("--heights", type=int, nargs="+", default=[100_000, 1_000_000], help="Crates per stack")
+    parser.add_argument("--moves", type=int, default=1_000)
+    parser.add_argument("--max-quantity", type=int, default=200_000, help="Most crates moved at once")
+    args = parser.parse_args(argv)
+
+    for height in args.heights:
+        seconds = benchmark(args.stacks, height, args.moves, args.max_quantity)
+        timings = " | ".join(f"{name} {elapsed:.4f}s" for name, elapsed in seconds.items())
+        print(f"{args.stacks} stacks x {height:>11,} crates | {args.moves:,} moves | {timings}")
+
+
+if __name__ == "__main__":
+    main()
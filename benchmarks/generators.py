@@ -0,0 +1,236 @@
+"""
+Deterministic generators for puzzle inputs of any size, one per day
+
+Every generator takes a size and a seeded random.Random and yields the input one line at a time, so inputs far bigger
+than memory can be written out. What size counts depends on the day: lines for most days, moves for day 5,
+characters for day 6 and terminal lines for day 7.
+
+Generators take extra keyword options (eg max_depth for day 7), set with --option NAME=VALUE, and PRESETS names the
+settings for inputs the defaults never produce.
+
+Usage:
+    python -m benchmarks.generators DAY SIZE OUTPUT [--seed SEED] [--option NAME=VALUE ...]
+    python -m benchmarks.generators 7 100000 deep.txt --preset deep-tree
+"""
+import argparse
+import random
+import string
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+ITEM_TYPES = string.ascii_lowercase + string.ascii_uppercase
+
+
+def calorie_lines(size: int, rng: random.Random) -> Iterator[str]:
+    """Day 1: groups of calorie counts, separated by blank lines"""
+    lines_left = size
+    while lines_left > 0:
+        group_size = min(rng.randint(1, 15), lines_left)
+        for _ in range(group_size):
+            yield f"{rng.randint(1_000, 70_000)}\n"
+
+        lines_left -= group_size
+        if lines_left > 0:
+            yield "\n"
+            lines_left -= 1
+
+
+def strategy_guide_lines(size: int, rng: random.Random) -> Iterator[str]:
+    """Day 2: one "<A|B|C> <X|Y|Z>" round per line"""
+    for _ in range(size):
+        yield f"{rng.choice('ABC')} {rng.choice('XYZ')}\n"
+
+
+def rucksack_lines(size: int, rng: random.Random, max_half_length: int = 24) -> Iterator[str]:
+    """
+    Day 3: rucksacks in groups of three
+
+    Each rucksack's halves share exactly one item type and each group shares exactly one badge, so the answers are
+    well defined. The size is rounded down to a whole number of groups.
+    """
+    for _ in range(size // 3):
+        item_types = list(ITEM_TYPES)
+        rng.shuffle(item_types)
+        badge, item_types = item_types[0], item_types[1:]
+        for elf in range(3):
+            # Each elf draws from its own 17 item types, so the badge is the only item common to the group
+            pool = item_types[elf * 17 : (elf + 1) * 17]
+            common, left_pool, right_pool = pool[0], pool[1:9], pool[9:]
+            half_length = rng.randint(2, max_half_length)
+
+            left = [common, badge] + rng.choices(left_pool, k=half_length - 2)
+            right = [common] + rng.choices(right_pool, k=half_length - 1)
+            rng.shuffle(left)
+            rng.shuffle(right)
+            yield "".join(left) + "".join(right) + "\n"
+
+
+def section_assignment_lines(size: int, rng: random.Random, max_section: int = 99) -> Iterator[str]:
+    """Day 4: pairs of "start-end" section assignments"""
+    for _ in range(size):
+        start_1, end_1 = sorted((rng.randint(1, max_section), rng.randint(1, max_section)))
+        start_2, end_2 = sorted((rng.randint(1, max_section), rng.randint(1, max_section)))
+        yield f"{start_1}-{end_1},{start_2}-{end_2}\n"
+
+
+def crate_stack_lines(
+    size: int, rng: random.Random, num_stacks: int = 9, stack_height: int = 50, max_quantity: int = 50
+) -> Iterator[str]:
+    """
+    Day 5: the starting crate drawing followed by size moves
+
+    Stack heights are tracked while generating so every move is valid and no stack is ever emptied, keeping a top
+    crate on every stack for the answer.
+    """
+    heights = [rng.randint(1, stack_height) for _ in range(num_stacks)]
+    for level in range(max(heights), 0, -1):
+        cells = [f"[{rng.choice(string.ascii_uppercase)}]" if height >= level else "   " for height in heights]
+        yield " ".join(cells) + "\n"
+
+    yield " ".join(f" {stack_num} " for stack_num in range(1, num_stacks + 1)) + "\n"
+    yield "\n"
+
+    for _ in range(size):
+        origin_stack = rng.choice([i for i, height in enumerate(heights) if height > 1] or [0])
+        dest_stack = rng.choice([i for i in range(num_stacks) if i != origin_stack])
+        if heights[origin_stack] > 1:
+            quantity = rng.randint(1, min(max_quantity, heights[origin_stack] - 1))
+        else:
+            quantity = 0
+
+        heights[origin_stack] -= quantity
+        heights[dest_stack] += quantity
+        yield f"move {quantity} from {origin_stack + 1} to {dest_stack + 1}\n"
+
+
+def data_stream_lines(size: int, rng: random.Random, chunk_size: int = 1024 * 1024) -> Iterator[str]:
+    """
+    Day 6: a single data stream of size chars
+
+    The stream is drawn from three letters and only ends in 14 unique ones, so both markers sit at the very end and
+    the whole stream has to be scanned.
+    """
+    marker = "".join(rng.sample(string.ascii_lowercase[3:], 14))
+    chars_left = max(size - len(marker), 0)
+    while chars_left > 0:
+        num_chars = min(chunk_size, chars_left)
+        yield "".join(rng.choices("abc", k=num_chars))
+        chars_left -= num_chars
+
+    yield marker + "\n"
+
+
+def terminal_lines(size: int, rng: random.Random, max_depth: int = 20, max_fanout: int = 4) -> Iterator[str]:
+    """
+    Day 7: terminal output of a depth first walk over a random directory tree, roughly size lines long
+
+    Every directory above max_depth has at least one sub directory, so the output is only shorter than size when
+    max_depth and max_fanout bound the whole tree. The walk uses an explicit stack so max_depth can go far past the
+    recursion limit, eg max_fanout=1 with a large max_depth gives a single very deep chain of directories (the
+    deep-tree preset).
+    """
+    yield "$ cd /\n"
+    lines_written = 1
+    dir_count = 0
+    # Entries are (dir name, depth) to enter a directory, or None to climb back out of one
+    stack: List[Optional[Tuple[Optional[str], int]]] = [(None, 0)]
+    while stack and lines_written < size:
+        entry = stack.pop()
+        if entry is None:
+            yield "$ cd ..\n"
+            lines_written += 1
+            continue
+
+        dir_name, depth = entry
+        if dir_name is not None:
+            yield f"$ cd {dir_name}\n"
+            lines_written += 1
+
+        num_dirs = rng.randint(1, max_fanout) if depth < max_depth else 0
+        sub_dirs = [f"d{dir_count + i}" for i in range(num_dirs)]
+        dir_count += num_dirs
+
+        yield "$ ls\n"
+        for sub_dir in sub_dirs:
+            yield f"dir {sub_dir}\n"
+
+        num_files = rng.randint(1, 5)
+        for file_num in range(num_files):
+            yield f"{rng.randint(1, 300_000)} f{file_num}.txt\n"
+
+        lines_written += 1 + num_dirs + num_files
+        for sub_dir in reversed(sub_dirs):
+            stack.append(None)
+            stack.append((sub_dir, depth + 1))
+
+
+GENERATORS: Dict[int, Callable[..., Iterator[str]]] = {
+    1: calorie_lines,
+    2: strategy_guide_lines,
+    3: rucksack_lines,
+    4: section_assignment_lines,
+    5: crate_stack_lines,
+    6: data_stream_lines,
+    7: terminal_lines,
+}
+
+# Named (day, generator options) settings, for inputs the default options never produce
+PRESETS: Dict[str, Tuple[int, Dict[str, int]]] = {
+    # One chain of directories as deep as size allows, far past the recursion limit
+    "deep-tree": (7, {"max_depth": 1_000_000, "max_fanout": 1}),
+}
+
+
+def parse_options(settings: List[str]) -> Dict[str, int]:
+    """Turns NAME=VALUE command line settings into generator keyword options"""
+    options = {}
+    for setting in settings:
+        name, separator, value = setting.partition("=")
+        if not separator:
+            raise ValueError(f"Generator options are set as NAME=VALUE, got {setting!r}")
+
+        options[name.replace("-", "_")] = int(value)
+
+    return options
+
+
+def write_input(day: int, size: int, output_location: str, seed: int = 2022, **options) -> str:
+    """Writes a generated input for the day to a file and returns its location"""
+    rng = random.Random(f"{day}:{size}:{seed}")
+    batch: List[str] = []
+    with open(output_location, "w") as output:
+        for line in GENERATORS[day](size, rng, **options):
+            batch.append(line)
+            if len(batch) >= 10_000:
+                output.writelines(batch)
+                batch.clear()
+
+        output.writelines(batch)
+
+    return output_location
+
+
+def main(argv: List[str] = None) -> None:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.generators", description=__doc__.strip().splitlines()[0]
+    )
+    parser.add_argument("day", type=int, nargs="?", choices=sorted(GENERATORS))
+    parser.add_argument("size", type=int)
+    parser.add_argument("output")
+    parser.add_argument("--seed", type=int, default=2022)
+    parser.add_argument("--option", action="append", default=[], help="Generator option as NAME=VALUE, repeatable")
+    parser.add_argument("--preset", choices=sorted(PRESETS), help="Named generator settings, also picks the day")
+    args = parser.parse_args(argv)
+
+    day, options = args.day, {}
+    if args.preset is not None:
+        day, options = PRESETS[args.preset]
+
+    if day is None:
+        parser.error("a day is needed unless a preset is given")
+
+    write_input(day, args.size, args.output, args.seed, **{**options, **parse_options(args.option)})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Measures how long the package and each day take to import, and checks them against a per target budget
+
+Every target is imported in a fresh interpreter under -X importtime. Only the imports triggered by the target itself
+are counted, not the interpreter's own startup, and the fastest of the repeated runs is kept. The report is written
+to import_times.json next to this file so changes in startup cost show up in review.
+
+Usage (from the repo root):
+    python -m benchmarks.import_time                   # measure, write the report and check the budgets
+    python -m benchmarks.import_time --repeat 10 --no-write
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from calendar.runner import discover_days
+from typing import Dict, List
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCHMARKS_DIR)
+MARKER = "-- import_time start --"
+
+# Microseconds, loose enough to absorb noise between machines but tight enough to catch a new eager dependency
+DEFAULT_BUDGET_US = 60_000
+BUDGETS_US: Dict[str, int] = {
+    "calendar": 50_000,
+    "calendar.runner": 60_000,
+}
+
+
+def _import_code(target: str) -> str:
+    """Code that imports a module by name, or a day by number, after writing a marker to stderr"""
+    if target.isdigit():
+        module_location = discover_days()[int(target)]
+        return (
+            "import importlib.util, sys\n"
+            f"sys.path.insert(0, {os.path.dirname(module_location)!r})\n"
+            f"spec = importlib.util.spec_from_file_location('aoc_day_{target}', {module_location!r})\n"
+            f"sys.stderr.write({MARKER!r} + '\\n')\n"
+            "spec.loader.exec_module(importlib.util.module_from_spec(spec))\n"
+        )
+
+    return f"import sys\nsys.stderr.write({MARKER!r} + '\\n')\nimport {target}\n"
+
+
+def parse_import_times(stderr: str) -> Dict[str, int]:
+    """Cumulative microseconds of each top level import listed after the marker"""
+    _, _, listing = stderr.partition(MARKER)
+    import_times = {}
+    for line in listing.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        _, cumulative, name = line[len("import time:") :].split("|")
+        # Nested imports are indented below the import that triggered them, and are already in its cumulative time
+        if name.startswith("  ") or not cumulative.strip().isdigit():
+            continue
+
+        import_times[name.strip()] = int(cumulative)
+
+    return import_times
+
+
+def measure(target: str, repeat: int = 5) -> dict:
+    """Imports a target repeat times, keeping the run with the smallest total"""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [REPO_DIR, os.environ.get("PYTHONPATH")]))}
+    runs = []
+    for _ in range(repeat):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", _import_code(target)],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=REPO_DIR,
+            env=env,
+        )
+        runs.append(parse_import_times(process.stderr))
+
+    fastest = min(runs, key=lambda run: sum(run.values()))
+    budget = BUDGETS_US.get(target, DEFAULT_BUDGET_US)
+    total = sum(fastest.values())
+    return {
+        "target": target,
+        "total_us": total,
+        "budget_us": budget,
+        "over_budget": total > budget,
+        "imports_us": dict(sorted(fastest.items(), key=lambda item: item[1], reverse=True)),
+    }
+
+
+def _format_result(result: dict) -> str:
+    target = f"day {result['target']}" if result["target"].isdigit() else result["target"]
+    slowest = ", ".join(f"{name} {us / 1000:.1f}ms" for name, us in list(result["imports_us"].items())[:3])
+    status = "OVER BUDGET" if result["over_budget"] else "ok"
+    return (
+        f"{target:<16} | {result['total_us'] / 1000:>6.1f}ms of {result['budget_us'] / 1000:.0f}ms | {status:<11} "
+        f"| {slowest}"
+    )
+
+
+def main(argv: List[str] = None) -> int:
+    """Command line entry point, returns 1 if any target is over budget"""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.import_time", description=__doc__.strip().splitlines()[0]
+    )
+    parser.add_argument(
+        "--targets",
+        nargs="+",
+        default=["calendar", "calendar.runner"] + [str(day) for day in discover_days()],
+        help="Module names, or day numbers",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Imports per target, the fastest is recorded")
+    parser.add_argument("--report", default=os.path.join(BENCHMARKS_DIR, "import_times.json"))
+    parser.add_argument("--no-write", dest="write", action="store_false", help="Only print and check the budgets")
+    args = parser.parse_args(argv)
+
+    results = [measure(target, args.repeat) for target in args.targets]
+    for result in results:
+        print(_format_result(result))
+
+    if args.write:
+        with open(args.report, "w") as report_file:
+            json.dump({"python": sys.version.split()[0], "results": results}, report_file, indent=2)
+            report_file.write("\n")
+
+    return 1 if any(result["over_budget"] for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+"""
+Ranks the elves of a large calorie file across a pool of worker processes
+
+The file is split into byte ranges that each start on a new elf, every worker ranks its own range with the chosen
+engine, and the per-range rankings are merged once the elf numbers are shifted by the elves in the ranges before.
+"""
+import heapq
+import mmap
+import os
+from calendar import AdventOfCode, LineSource
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, compress, count, repeat
+from operator import itemgetter, not_, sub
+from typing import List, Optional, Tuple
+
+Ranking = Tuple[List[Tuple[int, int]], int]
+
+
+def rank_file(
+    file_location: str, num_elves: int = 3, engine: str = "python", workers: int = None
+) -> List[Tuple[int, int]]:
+    """Finds the num_elves elves carrying the most calories, as (elf number, kcal) pairs in rank order"""
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if os.path.getsize(file_location) == 0:
+        return []
+
+    with open(file_location, "rb") as raw_data:
+        with mmap.mmap(raw_data.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            ranges = chunk_ranges(buffer, workers)
+
+    starts, ends = zip(*ranges)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        rankings = executor.map(rank_range, repeat(file_location), starts, ends, repeat(num_elves), repeat(engine))
+        return merge_rankings(rankings, num_elves)
+
+
+def chunk_ranges(buffer, num_chunks: int) -> List[Tuple[int, int]]:
+    """
+    Splits the buffer into at most num_chunks byte ranges of roughly equal size, each starting on a new elf
+
+    Notes
+    ------
+    Every range is cut just after a blank line, so no elf spans two ranges. An elf straddling a nominal cut point is
+    left whole in the range it started in, which makes that range a little longer and may merge it with the next.
+    """
+    end_of_buffer = len(buffer)
+    ranges = []
+    start = 0
+    for chunk in range(1, num_chunks):
+        cut = _next_elf_start(buffer, max(end_of_buffer * chunk // num_chunks, start), end_of_buffer)
+        if cut >= end_of_buffer:
+            break
+
+        if cut > start:
+            ranges.append((start, cut))
+            start = cut
+
+    ranges.append((start, end_of_buffer))
+    return ranges
+
+
+def rank_range(file_location: str, start: int, end: int, num_elves: int, engine: str = "python") -> Ranking:
+    """Worker side: ranks the elves in one byte range of the file, numbering them from 1 within the range"""
+    if start == end:
+        return [], 0
+
+    with open(file_location, "rb") as raw_data:
+        with AdventOfCode.map_file(raw_data) as buffer:
+            if engine == "numpy":
+                from _vectorized_calories import rank_elves
+
+                ranking = rank_elves(buffer, num_elves, start, end)
+                if ranking is not None:
+                    return ranking
+
+            ranking = rank_plain_rows(buffer, num_elves, start, end)
+            if ranking is not None:
+                return ranking
+
+            from elf_calories import ElfCalories
+
+            return ElfCalories._rank_calories(LineSource.iter_buffer_lines(buffer, start=start, end=end), num_elves)
+
+
+def rank_plain_rows(
+    buffer, num_elves: int = 3, start: int = 0, end: int = None, block_size: int = 16 * 1024 * 1024
+) -> Optional[Ranking]:
+    """
+    Ranks the elves between the start and end offsets without numpy, None if any row is more than plain digits
+
+    Notes
+    ------
+    Each block of whole lines is split into rows with one bytes.split, then the rows are converted with map(int),
+    running totals built with accumulate and the blank rows found with compress, so no Python level code runs per
+    row. Rows with anything but digits (whitespace, signs) give None, leaving them to the line by line parse, which
+    reads them exactly as ElfCalories.sum_calories does.
+    """
+    from elf_calories import ElfCalories
+
+    ranked: List[Tuple[int, int]] = []
+    elves_finished = 0
+    carried_kcal = 0
+    elf_open = False
+    for block in AdventOfCode.line_blocks(buffer, block_size, start, end):
+        data = bytes(block)
+        del block
+        if b"\r" in data:
+            data = data.replace(b"\r\n", b"\n")
+
+        digits = data.translate(None, b"\n")
+        if digits and not digits.isdigit():
+            return None
+
+        rows = (data[:-1] if data.endswith(b"\n") else data).split(b"\n")
+        running_kcal = list(accumulate(map(int, filter(None, rows)), initial=0))
+        # Every blank row closes an elf, holding the values since the blank row before. A blank row's position less
+        # the blank rows before it is how many values come before it, so where it cuts the running totals.
+        cuts = list(map(sub, compress(count(), map(not_, rows)), count()))
+        totals = list(map(sub, map(running_kcal.__getitem__, cuts), map(running_kcal.__getitem__, [0] + cuts)))
+        if cuts:
+            totals[0] += carried_kcal
+            carried_kcal = running_kcal[-1] - running_kcal[cuts[-1]]
+            elf_open = cuts[-1] < len(running_kcal) - 1
+        else:
+            carried_kcal += running_kcal[-1]
+            elf_open = elf_open or len(running_kcal) > 1
+
+        # nlargest keeps the earlier elf among equals, like sorting them
+        block_top = heapq.nlargest(num_elves, enumerate(totals, start=elves_finished + 1), key=itemgetter(1))
+        ranked = ElfCalories.merge_ranked(ranked + block_top, num_elves)
+        elves_finished += len(totals)
+
+    if elf_open:
+        ranked = ElfCalories.merge_ranked(ranked + [(elves_finished + 1, carried_kcal)], num_elves)
+        elves_finished += 1
+
+    return ranked, elves_finished
+
+
+def merge_rankings(rankings: List[Ranking], num_elves: int) -> List[Tuple[int, int]]:
+    """Combines the rankings of consecutive ranges, shifting each range's elf numbers past the ranges before it"""
+    candidates = []
+    elves_before = 0
+    for ranked, elf_count in rankings:
+        candidates.extend((elves_before + elf_number, kcal) for elf_number, kcal in ranked)
+        elves_before += elf_count
+
+    from elf_calories import ElfCalories
+
+    return ElfCalories.merge_ranked(candidates, num_elves)
+
+
+def _next_elf_start(buffer, position: int, end_of_buffer: int) -> int:
+    """The offset just past the first blank line found from position on, the end of the buffer if there is none"""
+    # Start one byte back so a cut point landing just after a line break still sees it
+    search_from = max(position - 1, 0)
+    cuts = []
+    for blank_line in (b"\n\n", b"\n\r\n"):
+        found = buffer.find(blank_line, search_from, end_of_buffer)
+        if found != -1:
+            cuts.append(found + len(blank_line))
+
+    return min(cuts, default=end_of_buffer)
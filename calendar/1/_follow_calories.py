@@ -0,0 +1,149 @@
+"""
+Follow mode for a calorie file that keeps being appended to
+
+The byte offset reached, the calories of the elf still being written and the best elves so far are saved between
+runs, so each update only reads what was appended since the last one.
+"""
+import hashlib
+import heapq
+import json
+import mmap
+import os
+from calendar import LineSource
+from typing import List, Tuple
+
+from elf_calories import ElfCalories
+
+# How much of the start of the file is hashed to notice it being replaced rather than appended to
+HEAD_BYTES = 4096
+
+
+class CalorieFollower:
+    """
+    Keeps the ranking of a growing calorie file up to date, reading only the bytes appended since the last update
+
+    Notes
+    ------
+    Only whole lines are consumed, a line still being written is counted towards the answer but read again next
+    time. If the file shrinks or its first bytes change it is treated as a new file and followed from the start.
+    """
+
+    STATE_VERSION = 1
+
+    def __init__(self, file_location: str, state_location: str = None, num_elves: int = 3):
+        self.file_location = os.path.abspath(file_location)
+        if state_location is None:
+            state_name = hashlib.sha256(self.file_location.encode()).hexdigest()[:16] + ".json"
+            state_location = os.path.join(os.path.expanduser("~"), ".cache", "adventofcode2022", "follow", state_name)
+
+        self.state_location = state_location
+        self.num_elves = num_elves
+        self.state = self._load_state()
+
+    def update(self) -> List[Tuple[int, int]]:
+        """Reads whatever was appended since the last update, saves the new state and returns the current ranking"""
+        with open(self.file_location, "rb") as raw_data:
+            file_size = os.fstat(raw_data.fileno()).st_size
+            if file_size == 0:
+                self.state = self._fresh_state()
+                return []
+
+            with mmap.mmap(raw_data.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                if not self._still_same_file(buffer, file_size):
+                    self.state = self._fresh_state()
+
+                offset = self.state["offset"]
+                line_end = buffer.rfind(b"\n", offset, file_size) + 1
+                if line_end > offset:
+                    self._consume(LineSource.iter_buffer_lines(buffer, start=offset, end=line_end))
+                    self.state["offset"] = line_end
+
+                self.state["head_digest"] = self._head_digest(buffer)
+                partial_row = buffer[max(line_end, offset) : file_size].strip()
+
+        self._save_state()
+        return self.ranking(int(partial_row) if partial_row else None)
+
+    def ranking(self, partial_kcal: int = None) -> List[Tuple[int, int]]:
+        """The best elves so far, counting the elf still being written as if its rows ended here"""
+        ranked = [tuple(elf) for elf in self.state["ranked"]]
+        current_kcal = self.state["carried_kcal"] + (partial_kcal or 0)
+        if self.state["elf_open"] or partial_kcal is not None:
+            ranked.append((self.state["elves"] + 1, current_kcal))
+
+        return ElfCalories.merge_ranked(ranked, self.num_elves)
+
+    def _consume(self, rows) -> None:
+        """Carries the open elf and the ranking forward over newly appended rows"""
+        top_elves = [(kcal, -elf_number) for elf_number, kcal in self.state["ranked"]]
+        heapq.heapify(top_elves)
+        elves = self.state["elves"]
+        current_cals = self.state["carried_kcal"]
+        in_group = self.state["elf_open"]
+        for row in rows:
+
+            if row == "":
+                elves += 1
+                ElfCalories._offer_elf(top_elves, self.num_elves, elves, current_cals)
+                current_cals = 0
+                in_group = False
+
+            else:
+                current_cals += int(row)
+                in_group = True
+
+        self.state.update(
+            elves=elves,
+            carried_kcal=current_cals,
+            elf_open=in_group,
+            ranked=ElfCalories._rank_elves(top_elves),
+        )
+
+    def _still_same_file(self, buffer, file_size: int) -> bool:
+        """Whether the saved state still describes the start of this file"""
+        if self.state["offset"] > file_size:
+            return False
+
+        return self.state["offset"] == 0 or self._head_digest(buffer) == self.state["head_digest"]
+
+    def _head_digest(self, buffer) -> str:
+        """Hash of the first bytes that had already been read, enough to notice the file being replaced"""
+        head_end = min(self.state["offset"], HEAD_BYTES)
+        return hashlib.sha256(buffer[:head_end]).hexdigest()
+
+    def _fresh_state(self) -> dict:
+        return {
+            "version": self.STATE_VERSION,
+            "file": self.file_location,
+            "num_elves": self.num_elves,
+            "offset": 0,
+            "head_digest": None,
+            "elves": 0,
+            "carried_kcal": 0,
+            "elf_open": False,
+            "ranked": [],
+        }
+
+    def _load_state(self) -> dict:
+        """The saved state, or a fresh one if there is none or it was saved for another file or ranking size"""
+        try:
+            with open(self.state_location) as state_file:
+                state = json.load(state_file)
+
+        except (FileNotFoundError, ValueError):
+            return self._fresh_state()
+
+        expected = (self.STATE_VERSION, self.file_location, self.num_elves)
+        if (state.get("version"), state.get("file"), state.get("num_elves")) != expected:
+            return self._fresh_state()
+
+        return state
+
+    def _save_state(self) -> None:
+        """Writes the state atomically, so a run killed part way through never leaves it half written"""
+        os.makedirs(os.path.dirname(self.state_location) or ".", exist_ok=True)
+        temp_location = f"{self.state_location}.{os.getpid()}.tmp"
+        with open(temp_location, "w") as state_file:
+            json.dump(self.state, state_file)
+
+        os.replace(temp_location, self.state_location)
@@ -0,0 +1,147 @@
+"""NumPy engine for summing and ranking elf calories straight from the raw input bytes"""
+from calendar import AdventOfCode
+from typing import List, Optional, Tuple
+
+import numpy as np
+from elf_calories import ElfCalories
+
+ZERO = ord("0")
+NEWLINE = ord("\n")
+# Longest row that fits an int64 whatever its digits
+MAX_DIGITS = 18
+# The bytes str.strip takes off the ends of an ASCII row, other than the line break
+WHITESPACE = np.zeros(256, dtype=bool)
+WHITESPACE[list(b" \t\r\x0b\x0c\x1c\x1d\x1e\x1f")] = True
+
+
+def top_elves(buffer, num_elves: int = 3, block_size: int = 16 * 1024 * 1024) -> Optional[List[Tuple[int, int]]]:
+    """
+    Finds the num_elves elves carrying the most calories, as (elf number, kcal) pairs in rank order, None if any row
+    is not a plain whole number
+    """
+    ranking = rank_elves(buffer, num_elves, block_size=block_size)
+    return None if ranking is None else ranking[0]
+
+
+def rank_elves(
+    buffer, num_elves: int = 3, start: int = 0, end: int = None, block_size: int = 16 * 1024 * 1024
+) -> Optional[Tuple[List[Tuple[int, int]], int]]:
+    """
+    Ranks the elves between the start and end offsets, returning the best num_elves and how many elves there were, or
+    None if any row is not a plain whole number
+
+    Notes
+    ------
+    The buffer is worked through in blocks that end on a line break, so memory stays bounded by the block size
+    rather than the input size. An elf still open at the end of a block carries its partial total into the next one.
+    Ranking matches ElfCalories.sum_calories: most calories first, and the earlier elf first among equals. Rows int()
+    would read differently (signs, underscores, more than MAX_DIGITS digits) give None, so the caller can fall back
+    to it.
+    """
+    ranked: List[Tuple[int, int]] = []
+    elves_finished = 0
+    carried_kcal = 0
+    elf_open = False
+    for block in AdventOfCode.line_blocks(buffer, block_size, start, end):
+        parsed_lines = _parse_lines(block)
+        del block
+        if parsed_lines is None:
+            return None
+
+        line_values, blank_lines = parsed_lines
+        if len(line_values) == 0:
+            continue
+
+        # Each elf's group runs up to and including the blank line that closes it, so no group is ever empty
+        group_starts = np.concatenate(([0], np.flatnonzero(blank_lines) + 1))
+        group_starts = group_starts[group_starts < len(line_values)]
+        totals = np.add.reduceat(line_values, group_starts)
+        totals[0] += carried_kcal
+
+        elf_open = not blank_lines[-1]
+        if elf_open:
+            carried_kcal, totals = int(totals[-1]), totals[:-1]
+        else:
+            carried_kcal = 0
+
+        ranked = ElfCalories.merge_ranked(ranked + _block_top_elves(totals, num_elves, elves_finished), num_elves)
+        elves_finished += len(totals)
+
+    if elf_open:
+        ranked = ElfCalories.merge_ranked(ranked + [(elves_finished + 1, carried_kcal)], num_elves)
+        elves_finished += 1
+
+    return ranked, elves_finished
+
+
+def _parse_lines(block) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Parses every line of a block into an int64 value, and flags the blank lines, None if any line is not all digits
+
+    Notes
+    ------
+    Lines are stripped of surrounding whitespace like the Python path's rows, so whitespace only lines are blank.
+    They are then lined up by their last digit and summed one place value at a time, so the Python level loop only
+    runs once per digit of the longest line rather than once per line.
+    """
+    raw = np.frombuffer(block, dtype=np.uint8)
+    line_starts, line_ends = AdventOfCode.line_bounds(raw)
+    if WHITESPACE[raw].any():
+        line_starts, line_ends = _strip_lines(raw, line_starts, line_ends)
+
+    line_lengths = line_ends - line_starts
+    if line_lengths.max(initial=0) > MAX_DIGITS:
+        return None
+
+    line_values = np.zeros(len(line_starts), dtype=np.int64)
+    place_value = np.int64(1)
+    for column in range(int(line_lengths.max(initial=0))):
+        digits = raw[np.maximum(line_ends - 1 - column, 0)]
+        digits -= ZERO
+        digits[line_lengths <= column] = 0
+        # Anything but a digit wraps around past 9 once the "0" is taken off
+        if digits.max() > 9:
+            return None
+
+        line_values += digits * place_value
+        place_value *= 10
+
+    return line_values, line_lengths == 0
+
+
+def _strip_lines(raw: np.ndarray, line_starts: np.ndarray, line_ends: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Moves each line's bounds in to its first and last non-whitespace bytes, lines with none become empty"""
+    content = np.flatnonzero(~WHITESPACE[raw] & (raw != NEWLINE))
+    if len(content) == 0:
+        return line_starts, line_starts
+
+    # The first content byte at or after each line start, and the last one before each line end
+    first = np.searchsorted(content, line_starts)
+    last = np.searchsorted(content, line_ends) - 1
+    has_content = first <= last
+    stripped_starts = np.where(has_content, content[np.minimum(first, len(content) - 1)], line_starts)
+    stripped_ends = np.where(has_content, content[np.maximum(last, 0)] + 1, line_starts)
+    return stripped_starts, stripped_ends
+
+
+def _block_top_elves(totals: np.ndarray, num_elves: int, elves_before: int) -> List[Tuple[int, int]]:
+    """
+    The best num_elves elves of one block, as (elf number, kcal) pairs
+
+    Notes
+    ------
+    argpartition finds the cut off total in linear time, but picks arbitrarily among elves tied at the cut off. Every
+    elf at or above it is kept and sorted instead, so ties still go to the earlier elf.
+    """
+    if num_elves <= 0 or len(totals) == 0:
+        return []
+
+    if len(totals) > num_elves:
+        cut_off = totals[np.argpartition(totals, -num_elves)[-num_elves:]].min()
+        candidates = np.flatnonzero(totals >= cut_off)
+    else:
+        candidates = np.arange(len(totals))
+
+    # lexsort sorts by its last key first: most calories, then lowest elf number
+    order = candidates[np.lexsort((candidates, -totals[candidates]))][:num_elves]
+    return [(elves_before + int(i) + 1, int(totals[i])) for i in order]
@@ -1,69 +1,194 @@
 """https://adventofcode.com/2022/day/1"""
+import heapq
+import os
 from calendar import AdventOfCode
-from typing import List
+from typing import Iterable, List, Tuple
 
 
 class ElfCalories(AdventOfCode):
     """Calorie Finder"""
 
-    def __init__(self):
-        super().__init__()
-        self.elf_list = None
-
-        self.main()
+    # Enough elves are ranked while parsing to answer both parts, and the parsed result changed shape in version 2
+    top_n = 3
+    parser_version = 2
+    engines = ("python", "numpy")
+    raw_engines = ("numpy",)
+    # Input files at least this big are split across a pool of worker processes, see workers
+    parallel_min_bytes = 64 * 1024 * 1024
 
     def main(self) -> None:
         """Main function"""
+        self._report_top_n_elves(1, self.solve_part1())
+        self._report_top_n_elves(3, self.solve_part2())
 
-        self.elf_list = self.sum_calories(self.text_file)
+    @classmethod
+    def follow(cls, file_location: str = None, state_location: str = None) -> "ElfCalories":
+        """
+        Creates a solver that only reads what was appended to the file since the last run
 
-        print("==== Task 1 ====")
-        self.find_top_n_elves(1)
+        Notes
+        ------
+        The offset reached, the elf still being written and the best elves so far are saved to state_location (by
+        default under ~/.cache/adventofcode2022/follow), so the cost of a run depends on how much was appended rather
+        than on the size of the file.
+        """
+        from _follow_calories import CalorieFollower
 
-        print("==== Task 2 ====")
-        self.find_top_n_elves()
+        obj = cls([])
+        obj.input_file_location = file_location or cls.input_file_location
+        obj._follower = CalorieFollower(obj.input_file_location, state_location, cls.top_n)
+        return obj
 
-    @staticmethod
-    def sum_calories(data: List[str]) -> list:
+    def parse(self) -> List[Tuple[int, int]]:
+        """Finds the elves carrying the most calories, as (elf number, kcal) pairs"""
+        if getattr(self, "_follower", None) is not None:
+            return self._follower.update()
+
+        if self._use_worker_pool():
+            from _chunked_calories import rank_file
+
+            return rank_file(self.input_file_location, self.top_n, self.engine, self.workers)
+
+        # The numpy engine works on the raw bytes, so rows handed over directly always take the Python path
+        if self.engine == "numpy":
+            with self.raw_input() as buffer:
+                if buffer is not None:
+                    from _vectorized_calories import top_elves
+
+                    ranked = top_elves(buffer, self.top_n)
+                    if ranked is not None:
+                        return ranked
+
+            self.reporter.info("Calorie rows are not all plain whole numbers, summing them row by row")
+
+        return self.sum_calories(self.text_file, self.top_n)
+
+    @property
+    def workers(self) -> int:
+        """Worker processes used for large inputs, set by AOC_WORKERS and defaulting to one per core"""
+        return self._worker_count()
+
+    def solve_part1(self) -> int:
+        """Total calories carried by the elf with the most calories"""
+        return sum(kcal for _, kcal in self.find_top_n_elves(1))
+
+    def solve_part2(self) -> int:
+        """Total calories carried by the top 3 elves"""
+        return sum(kcal for _, kcal in self.find_top_n_elves(3))
+
+    @classmethod
+    def sum_calories(cls, data: Iterable[str], num_elves: int = 3) -> List[Tuple[int, int]]:
         """
         Iterates over the opened file, stripping the read-in lines of any line breaks and summing the values.
 
         If the row is empty that means this is the delimiter between elves.
-        The calorie values need to be written to the list, and the sum reset.
+        The finished elf is offered to a bounded heap of the best elves so far, and the sum reset.
+
+        Notes
+        ------
+        The heap never holds more than num_elves entries, so the whole input is ranked in one O(n log N) pass without
+        keeping every elf's total. Elves are numbered as they are read, so ties keep the earlier elf and the numbers
+        are always the right ones.
         """
-        elf_list = []
+        ranked, _ = cls._rank_calories(data, num_elves)
+        return ranked
+
+    @classmethod
+    def _rank_calories(cls, data: Iterable[str], num_elves: int = 3) -> Tuple[List[Tuple[int, int]], int]:
+        """The body of sum_calories, also returning how many elves there were so ranked chunks can be merged"""
+        top_elves: List[Tuple[int, int]] = []
+        elf_number = 1
         current_cals = 0
+        in_group = False
         for row in data:
 
             if row == "":
-                elf_list.append(current_cals)
+                cls._offer_elf(top_elves, num_elves, elf_number, current_cals)
+                elf_number += 1
                 current_cals = 0
+                in_group = False
 
             else:
                 current_cals += int(row)
+                in_group = True
+
+        # The last elf has no blank line after it
+        if in_group:
+            cls._offer_elf(top_elves, num_elves, elf_number, current_cals)
+        else:
+            elf_number -= 1
+
+        return cls._rank_elves(top_elves), elf_number
 
-        return elf_list
+    def find_top_n_elves(self, num_elves: int = 3) -> List[Tuple[int, int]]:
+        """Part 2, Finding the elves that brought the top 3 amount of calories, as (elf number, kcal) pairs."""
+        if num_elves > self.top_n:
+            return self.sum_calories(self.text_file, num_elves)
 
-    def find_top_n_elves(self, num_elves: int = 3) -> None:
-        """Part 2, Finding the elves that brought the top 3 amount of calories."""
-        _elf_list = self.elf_list.copy()
-        _elf_list.sort()
+        return self.parsed[:num_elves]
 
-        total_kcal = 0
-        for i in range(num_elves):
-            print(f"Finding the elf who brought the #{i + 1} most calories")
-            index_val = i + 1
-            kcal = _elf_list[-index_val]
-            total_kcal += kcal
-            self._elf_finder(kcal)
+    @staticmethod
+    def _offer_elf(top_elves: List[Tuple[int, int]], num_elves: int, elf_number: int, kcal: int) -> None:
+        """
+        Keeps an elf if it is among the num_elves best seen so far
+
+        The heap is ordered (kcal, -elf number), so its root is the elf to drop next: the fewest calories, and the
+        latest elf among equals. A new elf always has the highest number so far, so it only displaces the root when it
+        carries strictly more.
+        """
+        if len(top_elves) < num_elves:
+            heapq.heappush(top_elves, (kcal, -elf_number))
+
+        elif num_elves and kcal > top_elves[0][0]:
+            heapq.heapreplace(top_elves, (kcal, -elf_number))
+
+    @staticmethod
+    def merge_ranked(elves: Iterable[Tuple[int, int]], num_elves: int) -> List[Tuple[int, int]]:
+        """
+        The best num_elves of any (elf number, kcal) pairs, most calories first and earlier elves first among equals
+
+        Notes
+        ------
+        Every ranking merge (blocks, worker ranges, follow mode) goes through here, so they all break ties the same way
+        as _rank_elves.
+        """
+        return sorted(elves, key=lambda elf: (-elf[1], elf[0]))[:num_elves]
+
+    @staticmethod
+    def _rank_elves(top_elves: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """Turns the heap into (elf number, kcal) pairs, most calories first and earlier elves first among equals"""
+        return [(-negative_elf_number, kcal) for kcal, negative_elf_number in sorted(top_elves, reverse=True)]
+
+    def _use_worker_pool(self) -> bool:
+        """Only files are split up, and only when they are big enough to outweigh starting the workers"""
+        return self._input_from_file and self._splits_file(self.input_file_location)
+
+    @classmethod
+    def _splits_file(cls, file_location: str) -> bool:
+        """Whether there is more than one worker, and the file is big enough to be worth splitting between them"""
+        return cls._worker_count() > 1 and os.path.getsize(file_location) >= cls.parallel_min_bytes
+
+    @classmethod
+    def _reads_raw_input(cls, file_location: str) -> bool:
+        """The workers read their byte ranges straight from the file as well, so its rows are not loaded for them"""
+        return super()._reads_raw_input(file_location) or cls._splits_file(file_location)
+
+    @staticmethod
+    def _worker_count() -> int:
+        return int(os.environ.get("AOC_WORKERS", "0")) or os.cpu_count() or 1
 
-        print(f"\nThe top {num_elves} brought {total_kcal}\n")
+    def _report_top_n_elves(self, num_elves: int, total_kcal: int) -> None:
+        """Reports the combined total of the elves that brought the most calories, and each of those elves"""
+        if self.reporter.enabled(self.reporter.INFO):
+            for i, (elf_number, kcal) in enumerate(self.find_top_n_elves(num_elves)):
+                self.reporter.info("Elf: %s brought the #%s most calories, %s", elf_number, i + 1, kcal)
 
-    def _elf_finder(self, kcal: int):
-        """Takes an input kcal amount and finds the elf that holds that much"""
-        elf_number = self.elf_list.index(kcal)
-        print(f"Elf: {elf_number + 1} brought {self.elf_list[elf_number]} calories")
+        self.reporter.result("The top %s brought %s", num_elves, total_kcal)
 
 
 if __name__ == "__main__":
-    ElfCalories()
+    # AOC_FOLLOW=1 only reads what was appended to the input since the last run
+    if os.environ.get("AOC_FOLLOW", "0") not in ("", "0"):
+        ElfCalories.follow().main()
+    else:
+        ElfCalories().main()
@@ -1,6 +1,9 @@
 """All the underlying classes used in the R/P/S game"""
-import abc
-from enum import Enum
+from enum import Enum, IntEnum
+from typing import Sequence, Tuple
+
+from _exceptions import ActionsError
+from _results import Outcome
 
 
 class ActionVars(Enum):
@@ -15,101 +18,118 @@ class ActionVars(Enum):
     SCISSORS_VALUE = 3
 
 
-class Action(abc.ABC):
-    """Abstract class for a "move" in the game"""
+class Move(IntEnum):
+    """The moves of the standard game, numbered so each move beats the one before it"""
+
+    ROCK = 0
+    PAPER = 1
+    SCISSORS = 2
+
+
+class Game:
+    """
+    Win/lose relations of a Rock-Paper-Scissors style game with any odd number of moves, as mod N arithmetic
+
+    Notes
+    ------
+    Moves are numbered 0..N-1 and a move beats the moves an odd number of places behind it (mod N), so every move
+    beats exactly half of the others. For N=3 that is Rock-Paper-Scissors, and ordering the moves Rock, Paper,
+    Scissors, Spock, Lizard gives Rock-Paper-Scissors-Lizard-Spock. Outcomes, required moves and scores are all O(1).
+    """
+
+    __slots__ = ("move_names", "size")
+
+    def __init__(self, move_names: Sequence[str]):
+        if len(move_names) < 3 or len(move_names) % 2 == 0:
+            raise ActionsError(f"A fair game needs an odd number of moves, at least 3, got {len(move_names)}")
+
+        self.move_names: Tuple[str, ...] = tuple(move_names)
+        self.size = len(move_names)
+
+    def outcome(self, me: int, them: int) -> Outcome:
+        """The outcome of a round for the player of me"""
+        difference = (me - them) % self.size
+        if difference == 0:
+            return Outcome.DRAW
+
+        return Outcome.WIN if difference % 2 else Outcome.LOSE
+
+    def move_for(self, outcome: Outcome, them: int) -> int:
+        """A move that gets the outcome against them, the nearest one round the circle when several would"""
+        if outcome == Outcome.DRAW:
+            return them
+
+        return (them + 1) % self.size if outcome == Outcome.WIN else (them - 1) % self.size
+
+    def beats(self, me: int, them: int) -> bool:
+        """Whether me beats them"""
+        return self.outcome(me, them) == Outcome.WIN
+
+    def move_value(self, move: int) -> int:
+        """What score a move gets per round, its place in the game counting from 1"""
+        return move + 1
+
+    def score(self, me: int, them: int) -> int:
+        """What a round scores for the player of me"""
+        return self.move_value(me) + self.outcome(me, them)
+
+
+RPS = Game([move.name.title() for move in Move])
+RPSLS = Game(["Rock", "Paper", "Scissors", "Spock", "Lizard"])
+
+
+class Action:
+    """
+    A "move" in the standard game
+
+    The relations between moves are worked out by RPS rather than written out per move, subclasses only say which
+    move they are.
+    """
+
+    __slots__ = ()
+    move: Move
 
     @property
-    @abc.abstractmethod
     def move_type(self) -> ActionVars:
         """What move this is"""
-        raise NotImplementedError
+        return ActionVars[self.move.name]
 
     @property
-    @abc.abstractmethod
     def weak_against(self) -> ActionVars:
         """What beats this move"""
-        raise NotImplementedError
+        return ActionVars[Move(RPS.move_for(Outcome.WIN, self.move)).name]
 
     @property
-    @abc.abstractmethod
     def strong_against(self) -> ActionVars:
         """What this move beats"""
-        raise NotImplementedError
+        return ActionVars[Move(RPS.move_for(Outcome.LOSE, self.move)).name]
 
     @property
-    @abc.abstractmethod
     def move_value(self) -> int:
         """What score this move gets per round"""
-        raise NotImplementedError
+        return RPS.move_value(self.move)
 
 
 class Rock(Action):
     """The Mighty Rock"""
 
-    @property
-    def move_type(self) -> ActionVars:
-        """I am ROCK"""
-        return ActionVars.ROCK
-
-    @property
-    def weak_against(self) -> ActionVars:
-        """PAPER Kills Me"""
-        return ActionVars.PAPER
-
-    @property
-    def strong_against(self) -> ActionVars:
-        """I Kill SCISSORS"""
-        return ActionVars.SCISSORS
-
-    @property
-    def move_value(self) -> int:
-        """What I am Worth"""
-        return ActionVars.ROCK_VALUE.value
+    __slots__ = ()
+    move = Move.ROCK
 
 
 class Paper(Action):
     """The Unsuspecting Paper"""
 
-    @property
-    def move_type(self) -> ActionVars:
-        """I am PAPER"""
-        return ActionVars.PAPER
-
-    @property
-    def weak_against(self) -> ActionVars:
-        """SCISSORS Kills Me"""
-        return ActionVars.SCISSORS
-
-    @property
-    def strong_against(self) -> ActionVars:
-        """I Kill ROCK"""
-        return ActionVars.ROCK
-
-    @property
-    def move_value(self) -> int:
-        """What I am Worth"""
-        return ActionVars.PAPER_VALUE.value
+    __slots__ = ()
+    move = Move.PAPER
 
 
 class Scissors(Action):
     """The Crafty Scissors"""
 
-    @property
-    def move_type(self) -> ActionVars:
-        """I am SCISSORS"""
-        return ActionVars.SCISSORS
+    __slots__ = ()
+    move = Move.SCISSORS
 
-    @property
-    def weak_against(self) -> ActionVars:
-        """ROCK Kills Me"""
-        return ActionVars.ROCK
-
-    @property
-    def strong_against(self) -> ActionVars:
-        """I Kill PAPER"""
-        return ActionVars.PAPER
 
-    @property
-    def move_value(self) -> int:
-        """What I am Worth"""
-        return ActionVars.SCISSORS_VALUE.value
+# Actions carry no state, so one of each is shared rather than created per round
+ACTIONS = {action.move: action for action in (Rock(), Paper(), Scissors())}
@@ -1,6 +1,5 @@
 """Objects representing the state of each round"""
-import abc
-from enum import Enum
+from enum import Enum, IntEnum
 
 
 class ResultVars(Enum):
@@ -15,59 +14,51 @@ class ResultVars(Enum):
     LOSE_SCORE = 0
 
 
-class Result(abc.ABC):
-    """Result of a Round of the R/P/S Game"""
+class Outcome(IntEnum):
+    """The outcome of a round, valued at what it scores"""
+
+    LOSE = ResultVars.LOSE_SCORE.value
+    DRAW = ResultVars.DRAW_SCORE.value
+    WIN = ResultVars.WIN_SCORE.value
+
+
+class Result:
+    """Result of a Round of the R/P/S Game, subclasses only say which outcome they are"""
+
+    __slots__ = ()
+    outcome: Outcome
 
     @property
-    @abc.abstractmethod
     def result(self) -> ResultVars:
         """What is the result of the round"""
-        raise NotImplementedError
+        return ResultVars[self.outcome.name]
 
     @property
-    @abc.abstractmethod
     def result_value(self) -> int:
         """What score this result is worth"""
-        raise NotImplementedError
+        return int(self.outcome)
 
 
 class Win(Result):
     """You Won!"""
 
-    @property
-    def result(self) -> ResultVars:
-        """I am a WIN"""
-        return ResultVars.WIN
-
-    @property
-    def result_value(self) -> int:
-        """What I am Worth"""
-        return ResultVars.WIN_SCORE.value
+    __slots__ = ()
+    outcome = Outcome.WIN
 
 
 class Draw(Result):
     """You Drew :/"""
 
-    @property
-    def result(self) -> ResultVars:
-        """I am a DRAW"""
-        return ResultVars.DRAW
-
-    @property
-    def result_value(self) -> int:
-        """What I am Worth"""
-        return ResultVars.DRAW_SCORE.value
+    __slots__ = ()
+    outcome = Outcome.DRAW
 
 
 class Lose(Result):
     """You Lose :("""
 
-    @property
-    def result(self) -> ResultVars:
-        """I am a LOSS"""
-        return ResultVars.LOSE
+    __slots__ = ()
+    outcome = Outcome.LOSE
 
-    @property
-    def result_value(self) -> int:
-        """What I am Worth"""
-        return ResultVars.LOSE_SCORE.value
+
+# Results carry no state, so one of each is shared rather than created per round
+RESULTS = {result.outcome: result for result in (Win(), Draw(), Lose())}
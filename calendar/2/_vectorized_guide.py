@@ -0,0 +1,55 @@
+"""NumPy engine for the strategy guide histogram, reading the raw bytes as fixed width records"""
+from typing import Dict, Optional
+
+import numpy as np
+
+LINE_WIDTH = len("A X\n")
+
+
+def line_histogram(buffer, block_lines: int = 4 * 1024 * 1024) -> Optional[Dict[str, int]]:
+    """
+    Counts each kind of line straight from the bytes, None if the guide is not laid out as "<A|B|C> <X|Y|Z>\\n" lines
+
+    Notes
+    ------
+    Every line is exactly 4 bytes, so the buffer is viewed as an (n, 4) array without copying and the opponent and
+    player columns are turned into a 0..8 line kind with a couple of vectorised ops. Lines are counted in blocks so
+    the temporary arrays stay small however big the guide is. A missing line break after the last line is allowed,
+    anything else irregular (Windows line endings, blank lines, stray spaces) returns None for the caller to fall
+    back on the line by line path.
+    """
+    size = len(buffer)
+    if size % LINE_WIDTH == LINE_WIDTH - 1:
+        # No line break after the last line, check that line on its own and count the rest as usual
+        last_line = bytes(buffer[size - LINE_WIDTH + 1 :]) + b"\n"
+        size -= LINE_WIDTH - 1
+    elif size % LINE_WIDTH == 0:
+        last_line = b""
+    else:
+        return None
+
+    counts = np.zeros(9, dtype=np.int64)
+    records = np.frombuffer(buffer, dtype=np.uint8, count=size).reshape(-1, LINE_WIDTH)
+    if not _count_records(records, counts, block_lines):
+        return None
+
+    if last_line and not _count_records(np.frombuffer(last_line, dtype=np.uint8).reshape(1, -1), counts, 1):
+        return None
+
+    kinds = [f"{them} {me}" for them in "ABC" for me in "XYZ"]
+    return {kind: int(count) for kind, count in zip(kinds, counts) if count}
+
+
+def _count_records(records: np.ndarray, counts: np.ndarray, block_lines: int) -> bool:
+    """Adds the (n, 4) records to the counts of each line kind, False as soon as a record is malformed"""
+    for start in range(0, len(records), block_lines):
+        block = records[start : start + block_lines]
+        them = block[:, 0] - np.uint8(ord("A"))
+        me = block[:, 2] - np.uint8(ord("X"))
+        # Anything outside A-C or X-Z wraps round past 2 once the letter is taken off
+        if them.max() > 2 or me.max() > 2 or (block[:, 1] != ord(" ")).any() or (block[:, 3] != ord("\n")).any():
+            return False
+
+        counts += np.bincount(them * np.uint8(3) + me, minlength=9)
+
+    return True
@@ -1,79 +1,175 @@
 """https://adventofcode.com/2022/day/2"""
-import logging
 from calendar import AdventOfCode
-from typing import TextIO
+from collections import Counter
+from itertools import permutations
+from typing import Callable, Dict, Iterable, List, Mapping, Tuple, Union
 
 from _exceptions import ActionsError, ResultsError
-from _moves import Action, ActionVars, Paper, Rock, Scissors
-from _results import Draw, Lose, Result, ResultVars, Win
-
-logging.basicConfig(level=logging.INFO)
+from _moves import ACTIONS, RPS, Action, Move
+from _results import RESULTS, Outcome, Result
 
 
 class RPSSimulator(AdventOfCode):
     """Rock, Paper, Scissors Simulator"""
 
-    def __init__(self):
-        super().__init__()
+    _MOVE_CODES = {
+        "A": Move.ROCK,
+        "B": Move.PAPER,
+        "C": Move.SCISSORS,
+        "X": Move.ROCK,
+        "Y": Move.PAPER,
+        "Z": Move.SCISSORS,
+    }
+    _OUTCOME_CODES = {"X": Outcome.LOSE, "Y": Outcome.DRAW, "Z": Outcome.WIN}
+
+    engines = ("python", "numpy")
+    raw_engines = ("numpy",)
+
+    def parse(self) -> Dict[str, int]:
+        """Counts how many times each line appears, there are only 9 possible rounds however long the guide is"""
+        if self.engine == "numpy":
+            with self.raw_input() as buffer:
+                if buffer is not None:
+                    from _vectorized_guide import line_histogram
+
+                    histogram = line_histogram(buffer)
+                    if histogram is not None:
+                        return histogram
+
+            self.reporter.info("Guide is not laid out in fixed width lines, counting it line by line")
+
+        histogram = Counter(self.text_file)
+        histogram.pop("", None)
+        return dict(histogram)
+
+    def solve_part1(self) -> int:
+        """Total score if the XYZ values are my moves"""
+        return self.task_one()
+
+    def solve_part2(self) -> int:
+        """Total score if the XYZ values are the desired outcomes"""
+        return self.task_two()
+
+    def task_one(self) -> int:
+        """Task one, simulate on the assumption the XYZ values are my moves."""
+        return self._score_guide(self._play_move_round)
 
-        self._var_name_to_class = {
-            ResultVars.LOSE: Lose(),
-            ResultVars.DRAW: Draw(),
-            ResultVars.WIN: Win(),
-            ActionVars.ROCK: Rock(),
-            ActionVars.PAPER: Paper(),
-            ActionVars.SCISSORS: Scissors(),
-        }
+    def task_two(self) -> int:
+        """Task two, convert the XYZ to the result I need and simulate that"""
+        return self._score_guide(self._play_outcome_round)
+
+    def evaluate_strategies(self, mappings: Iterable[Mapping[str, Union[Move, Outcome]]]) -> List[int]:
+        """
+        Scores the guide under any number of readings of X/Y/Z, from the one line histogram
+
+        Notes
+        ------
+        Each mapping sends X, Y and Z to a Move (what I play) or an Outcome (what I need, the move is then chosen to
+        get it), so task one is {"X": Move.ROCK, "Y": Move.PAPER, "Z": Move.SCISSORS} and task two is
+        outcome_mapping(). The input is only scanned once, for the histogram, after which each mapping costs at most 9
+        lookups whatever the length of the guide.
+        """
+        rounds = []
+        for line, count in self.parsed.items():
+            them, code = line.split(" ")
+            rounds.append((self._move_code_translation(them).move, code, count))
+
+        scores = []
+        for mapping in mappings:
+            my_score = 0
+            for them, code, count in rounds:
+                try:
+                    played = mapping[code]
+                except KeyError:
+                    raise ActionsError(f"Strategy mapping has no entry for {code}: {mapping}") from None
+
+                me = RPS.move_for(played, them) if isinstance(played, Outcome) else played
+                my_score += RPS.score(me, them) * count
+
+            scores.append(my_score)
+
+        return scores
 
-        self.main()
+    @staticmethod
+    def move_permutations() -> List[Dict[str, Move]]:
+        """Every way of reading X/Y/Z as distinct moves, the candidate mappings for task one"""
+        return [dict(zip("XYZ", moves)) for moves in permutations(Move)]
+
+    @classmethod
+    def outcome_mapping(cls) -> Dict[str, Outcome]:
+        """Reading X/Y/Z as the outcome I need, the mapping for task two"""
+        return dict(cls._OUTCOME_CODES)
+
+    def score_table(self, play_round: Callable[[str], Tuple[Action, Action, Result, int]]) -> Dict[str, int]:
+        """
+        The score of every possible line under one way of playing a round, worked out once with the game classes
+
+        Notes
+        ------
+        Every guide line is one of 9 combinations of A/B/C and X/Y/Z, so playing each of them once gives a 3x3 table
+        that scores any number of rounds without creating a single game object per round.
+        """
+        return {f"{them} {code}": play_round(f"{them} {code}")[3] for them in "ABC" for code in "XYZ"}
+
+    def _score_guide(self, play_round: Callable[[str], Tuple[Action, Action, Result, int]]) -> int:
+        """Total score of the guide: the line histogram dotted with the score table"""
+        if self.reporter.tracing:
+            return self._trace_guide(play_round)
+
+        score_table = self.score_table(play_round)
+        my_score = 0
+        for line, count in self.parsed.items():
+            # A line outside the table is malformed, playing it directly raises the same error as before
+            round_score = score_table[line] if line in score_table else play_round(line)[3]
+            my_score += round_score * count
 
-    def main(self) -> None:
-        """Main function"""
-        # self.task_one(raw_data)
-        self.task_two()
+        return my_score
 
-    def task_one(self) -> None:
-        """Task one, simulate on the assumption the XYZ values are my moves."""
-        logging.info("Task 1")
+    def _trace_guide(self, play_round: Callable[[str], Tuple[Action, Action, Result, int]]) -> int:
+        """Plays the guide one round at a time in order, so every round can be traced"""
         my_score = 0
         for row in self.text_file:
-            them, me = row.split(" ")
+            if row == "":
+                continue
 
-            them = self._move_code_translation(them)
-            me = self._move_code_translation(me)
+            me, them, result, round_score = play_round(row)
+            my_score += round_score
+            self._trace_round(me, them, result, round_score, my_score)
 
-            result = self.compare_moves(me, them)
-            round_score = self.calc_score(me, result)
+        return my_score
 
-            my_score += round_score
-            logging.debug(
-                f"{me.move_type.value:8} vs {them.move_type.value:8} = {result.result.value:4} "
-                f"({me.move_value} + {result.result_value} = {round_score}) Running Total: {my_score}"
-            )
+    def _play_move_round(self, row: str) -> Tuple[Action, Action, Result, int]:
+        """Plays one line with the XYZ value as my move"""
+        them, me = row.split(" ")
 
-        logging.info(f"Total score: {my_score}")
+        them = self._move_code_translation(them)
+        me = self._move_code_translation(me)
 
-    def task_two(self) -> None:
-        """Task two, convert the XYZ to the result I need and simulate that"""
-        logging.info("Task 2")
-        my_score = 0
-        for row in self.text_file:
-            them, desired_outcome = row.split(" ")
+        result = self.compare_moves(me, them)
+        return me, them, result, self.calc_score(me, result)
 
-            them = self._move_code_translation(them)
-            desired_outcome = self._desired_outcome_translation(desired_outcome)
-            me = self.set_action_by_desired_outcome(desired_outcome, them)
+    def _play_outcome_round(self, row: str) -> Tuple[Action, Action, Result, int]:
+        """Plays one line with the XYZ value as the outcome I need"""
+        them, desired_outcome = row.split(" ")
 
-            result = self.compare_moves(me, them)
-            round_score = self.calc_score(me, result)
+        them = self._move_code_translation(them)
+        desired_outcome = self._desired_outcome_translation(desired_outcome)
+        me = self.set_action_by_desired_outcome(desired_outcome, them)
 
-            my_score += round_score
-            logging.info(
-                f"{me.move_type.value:8} vs {them.move_type.value:8} = {result.result.value:4} "
-                f"({me.move_value} + {result.result_value} = {round_score}) Running Total: {my_score}"
-            )
+        result = self.compare_moves(me, them)
+        return me, them, result, self.calc_score(me, result)
 
-        logging.info(f"Total score: {my_score}")
+    def _trace_round(self, me: Action, them: Action, result: Result, round_score: int, my_score: int) -> None:
+        self.reporter.trace(
+            "%-8s vs %-8s = %-4s (%s + %s = %s) Running Total: %s",
+            me.move_type.value,
+            them.move_type.value,
+            result.result.value,
+            me.move_value,
+            result.result_value,
+            round_score,
+            my_score,
+        )
 
     @staticmethod
     def compare_moves(
@@ -81,94 +177,38 @@ class RPSSimulator(AdventOfCode):
         player_two_move: Action,
     ) -> Result:
         """Compares two moves and determines the outcome"""
-
-        if player_one_move.move_type == player_two_move.move_type:
-            logging.debug("Moves match; Round is a draw")
-            return Draw()
-
-        elif player_one_move.move_type == player_two_move.weak_against:
-            logging.debug("Player 2 is weak against this; Round is a win")
-            return Win()
-
-        elif player_one_move.move_type == player_two_move.strong_against:
-            logging.debug("Player 2 is strong against this; Round is a loss")
-            return Lose()
-
-        else:
-            raise ActionsError(f"Unexpected outcome between: {player_one_move.move_type} & {player_two_move.move_type}")
+        return RESULTS[RPS.outcome(player_one_move.move, player_two_move.move)]
 
     @staticmethod
     def calc_score(move: Action, result: Result) -> int:
         """Taking the move played and the outcome, find the score for that round"""
-        logging.debug("Extracting score values from the Action and Result objects")
-        move_score = move.move_value
-        result_score = result.result_value
-        total_score = move_score + result_score
-
-        return total_score
+        return move.move_value + result.result_value
 
     def set_action_by_desired_outcome(
         self,
         desired_outcome: Result,
         them: Action,
     ) -> Action:
-        """Depending on what"""
-        if desired_outcome.result == ResultVars.WIN:
-            logging.debug("I need to Win, setting to opponent's weakness")
-            me = them.weak_against
-
-        elif desired_outcome.result == ResultVars.DRAW:
-            logging.debug("I need to Draw, setting to opponent type")
-            me = them.move_type
-
-        elif desired_outcome.result == ResultVars.LOSE:
-            logging.debug("I need to Lose, setting to opponent's strength")
-            me = them.strong_against
-
-        else:
-            raise ResultsError(f"Unexpected Result.result value: {desired_outcome.result}")
+        """Picks the move that gets the desired outcome against them"""
+        if not isinstance(desired_outcome, Result):
+            raise ResultsError(f"Unexpected desired outcome: {desired_outcome}")
 
-        return self._var_name_to_class.get(me)
+        return ACTIONS[RPS.move_for(desired_outcome.outcome, them.move)]
 
     def _move_code_translation(self, move_code: str) -> Action:
-        """Converts a move code string to a Variable type, then returns a Result Object"""
-
-        if move_code in ["X", "Y", "Z"]:
-            move_code = self._xyz_to_abc_translation(move_code)
-
-        logging.debug("Converting Move Code to the Action it represents")
-        abc_to_var_name = {
-            "A": ActionVars.ROCK,
-            "B": ActionVars.PAPER,
-            "C": ActionVars.SCISSORS,
-        }
-        a = abc_to_var_name.get(move_code)
-
-        return self._var_name_to_class.get(a)
-
-    @staticmethod
-    def _xyz_to_abc_translation(move_code: str) -> str:
-        logging.debug("Converting Player 2 code to Player 1 equivalent")
-        _xyz_to_abc = {
-            "X": "A",
-            "Y": "B",
-            "Z": "C",
-        }
-        move_code = _xyz_to_abc.get(move_code)
-        return move_code
+        """Converts an A/B/C or X/Y/Z move code to the Action it represents"""
+        try:
+            return ACTIONS[self._MOVE_CODES[move_code]]
+        except KeyError:
+            raise ActionsError(f"Unexpected move code: {move_code}") from None
 
     def _desired_outcome_translation(self, desired_outcome_code: str) -> Result:
-        """Converts a desired outcome code string to a Variable type, then returns a Result Object"""
-        logging.debug("Converting the desired outcome code to a Result object")
-        xyz_to_var_name = {
-            "X": ResultVars.LOSE,
-            "Y": ResultVars.DRAW,
-            "Z": ResultVars.WIN,
-        }
-        desired_outcome_code = xyz_to_var_name.get(desired_outcome_code)
-
-        return self._var_name_to_class.get(desired_outcome_code)
+        """Converts a desired outcome code to the Result it represents"""
+        try:
+            return RESULTS[self._OUTCOME_CODES[desired_outcome_code]]
+        except KeyError:
+            raise ResultsError(f"Unexpected desired outcome code: {desired_outcome_code}") from None
 
 
 if __name__ == "__main__":
-    obj = RPSSimulator()
+    RPSSimulator().main()
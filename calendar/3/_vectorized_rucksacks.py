@@ -0,0 +1,121 @@
+"""NumPy engine for the rucksacks, encoding every line of the raw input as uint64 item masks in bulk"""
+import string
+from calendar import AdventOfCode
+from typing import Tuple
+
+import numpy as np
+
+# The mask bit of every byte, 0 for anything that is not an item
+ITEM_BITS = np.zeros(256, dtype=np.uint64)
+for _bit, _item in enumerate(string.ascii_lowercase + string.ascii_uppercase):
+    ITEM_BITS[ord(_item)] = np.uint64(1) << np.uint64(_bit)
+
+
+def encode_rucksacks(buffer, block_size: int = 4 * 1024 * 1024) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Encodes every rucksack as (items in both compartments, items in the whole rucksack) uint64 mask arrays
+
+    Notes
+    ------
+    Each byte is looked up as its item bit, and the bits of each compartment are ORed together with one
+    bitwise_or.reduceat over the compartment boundaries. Blocks of the input are encoded one at a time, so the only
+    memory that grows with the input is the two masks kept per line.
+    """
+    common_blocks, rucksack_blocks = [], []
+    for block in AdventOfCode.line_blocks(buffer, block_size):
+        common_items, rucksack_items = _encode_block(block)
+        common_blocks.append(common_items)
+        rucksack_blocks.append(rucksack_items)
+        del block
+
+    if not common_blocks:
+        return np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=np.uint64)
+
+    return np.concatenate(common_blocks), np.concatenate(rucksack_blocks)
+
+
+def _encode_block(block) -> Tuple[np.ndarray, np.ndarray]:
+    """Encodes the lines of one block"""
+    raw = np.frombuffer(block, dtype=np.uint8)
+    line_starts, line_ends = AdventOfCode.line_bounds(raw)
+    half_points = line_starts + (line_ends - line_starts) // 2
+
+    # Every byte from a line's start up to its end is an item, anything after is a line break
+    item_bits = ITEM_BITS[raw]
+    line_edges = np.zeros(len(raw) + 1, dtype=np.int8)
+    line_edges[line_starts] += 1
+    line_edges[line_ends] -= 1
+    in_line = np.cumsum(line_edges[:-1], dtype=np.int8) > 0
+    not_items = in_line & (item_bits == 0)
+    if not_items.any():
+        bad_byte = int(np.flatnonzero(not_items)[0])
+        raise ValueError(f"Rucksacks can only hold a-z and A-Z, found {bytes(block[bad_byte:bad_byte + 1])!r}")
+
+    # The padding 0 keeps every boundary a valid index, and line breaks are worth 0 so they never add an item
+    item_bits = np.append(item_bits, np.uint64(0))
+    boundaries = np.empty(2 * len(line_starts), dtype=np.int64)
+    boundaries[0::2] = line_starts
+    boundaries[1::2] = half_points
+    compartments = np.bitwise_or.reduceat(item_bits, boundaries)
+    # reduceat gives the element itself for an empty range rather than 0. A line of length 0 or 1 has an empty first
+    # half, whose element would be the line's break or its one item, so those first halves are zeroed. Second halves
+    # are never empty for a line with items, and for an empty line cover its line break or the padding, both 0
+    first_halves, second_halves = compartments[0::2], compartments[1::2]
+    first_halves[half_points == line_starts] = 0
+
+    return first_halves & second_halves, first_halves | second_halves
+
+
+def priority_total(masks: np.ndarray) -> int:
+    """Sums the priorities of every item in every mask"""
+    single_items = (masks & (masks - np.uint64(1))) == 0
+    # Powers of two below 2^53 are exact as floats, and frexp gives their exponent + 1, which is the priority
+    _, priorities = np.frexp(masks[single_items].astype(np.float64))
+    total = int(priorities.sum())
+
+    for mask in masks[~single_items].tolist():
+        while mask:
+            lowest_item = mask & -mask
+            total += lowest_item.bit_length()
+            mask ^= lowest_item
+
+    return total
+
+
+def group_masks(masks: np.ndarray, group_size: int = 3, sliding: bool = False) -> np.ndarray:
+    """
+    The items common to each group of group_size consecutive rucksacks
+
+    Notes
+    ------
+    Distinct groups are a reshape and a bitwise_and.reduce, with a short last group if the rucksacks do not divide
+    evenly. Sliding groups (every window of group_size) AND together power of two sized windows, so they take
+    O(n log group_size) rather than O(n * group_size).
+    """
+    if group_size < 1:
+        raise ValueError(f"Groups need at least one rucksack, got {group_size}")
+
+    if not sliding:
+        full_groups = len(masks) // group_size * group_size
+        grouped = np.bitwise_and.reduce(masks[:full_groups].reshape(-1, group_size), axis=1)
+        if full_groups < len(masks):
+            grouped = np.append(grouped, np.bitwise_and.reduce(masks[full_groups:]))
+
+        return grouped
+
+    num_windows = len(masks) - group_size + 1
+    if num_windows <= 0:
+        return np.zeros(0, dtype=np.uint64)
+
+    grouped = np.full(num_windows, np.iinfo(np.uint64).max, dtype=np.uint64)
+    # window[i] is the AND of masks[i : i + width], width doubling each round
+    window, width, covered = masks, 1, 0
+    while width <= group_size:
+        if group_size & width:
+            grouped &= window[covered : covered + num_windows]
+            covered += width
+
+        window = window[:-width] & window[width:]
+        width *= 2
+
+    return grouped
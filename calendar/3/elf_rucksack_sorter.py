@@ -1,88 +1,148 @@
 """https://adventofcode.com/2022/day/3"""
 import string
+from array import array
 from calendar import AdventOfCode
-from typing import List
+from collections import deque
+from functools import reduce
+from operator import and_
+from typing import Iterable, Iterator, List, Tuple, TypeVar
+
+T = TypeVar("T")
 
 
 class RucksackSorter(AdventOfCode):
     """Finds common elements in strings"""
 
-    def __init__(self):
-        super().__init__()
-        self.priority_dict = self._priority()
+    _ITEM_BITS = {item: 1 << bit for bit, item in enumerate(string.ascii_lowercase + string.ascii_uppercase)}
+
+    parser_version = 3
+    engines = ("python", "numpy")
+    raw_engines = ("numpy",)
+
+    def solve_part1(self) -> int:
+        """Sum of the priorities of the items found in both compartments"""
+        return self.task_one()
 
-        self.task_one()
-        self.task_two()
+    def solve_part2(self) -> int:
+        """Sum of the priorities of the badge items shared by each group of elves"""
+        return self.task_two()
+
+    def parse(self) -> Tuple[array, array]:
+        """
+        Encodes each rucksack once, as two columns of 52 bit item masks: the items in both compartments and the
+        items anywhere in the rucksack
 
-    def task_one(self) -> None:
-        """Compares the two rucksack compartments for common elements and values them"""
-        value_list = []
+        Notes
+        ------
+        Both engines give the same unsigned 64 bit arrays, one mask per line in each, so the parse cache can be shared
+        between them and memory stays at 16 bytes per rucksack.
+        """
+        if self.engine == "numpy":
+            with self.raw_input() as buffer:
+                if buffer is not None:
+                    from _vectorized_rucksacks import encode_rucksacks
+
+                    return tuple(array("Q", masks.tobytes()) for masks in encode_rucksacks(buffer))
+
+        encode_items = self.encode_items
+        common_masks, rucksack_masks = array("Q"), array("Q")
         for rucksack in self.text_file:
             rucksack_half_point = len(rucksack) // 2
-            compartment_1, compartment_2 = rucksack[:rucksack_half_point], rucksack[rucksack_half_point:]
-            common_elements = self.find_intersection([compartment_1, compartment_2])
-            value_list.extend(self.find_and_value_occurrences(common_elements))
+            compartment_1 = encode_items(rucksack[:rucksack_half_point])
+            compartment_2 = encode_items(rucksack[rucksack_half_point:])
+            common_masks.append(compartment_1 & compartment_2)
+            rucksack_masks.append(compartment_1 | compartment_2)
 
-        self._calc_value(value_list)
+        return common_masks, rucksack_masks
 
-    def task_two(self) -> None:
-        """Identify the item that is in all bags per 3 elf groupings"""
-        print("=" * 20)
+    def task_one(self) -> int:
+        """Values the items found in both compartments of each rucksack"""
+        common_masks, _ = self.parsed
+        if self.engine == "numpy":
+            import numpy as np
+            from _vectorized_rucksacks import priority_total
 
-        value_list = []
-        grouped_rucksacks = self.group_elves(self.text_file)
-        for group in grouped_rucksacks:
-            common_elements = self.find_intersection(group)
-            value_list.extend(self.find_and_value_occurrences(common_elements))
+            return priority_total(np.frombuffer(common_masks, dtype=np.uint64))
 
-        self._calc_value(value_list)
+        return sum(map(self.mask_priority, common_masks))
 
-    @staticmethod
-    def group_elves(raw_data: List[str], group_size: int = 3) -> List[List[str]]:
-        """Groups up the rows to sets of 3"""
-        elf_list = []
-        sub_list = []
-        for e, rucksack in enumerate(raw_data, start=1):
-            sub_list.append(rucksack)
-            if e % group_size == 0:
-                elf_list.append(sub_list)
-                sub_list = []
+    def task_two(self, group_size: int = 3, sliding: bool = False) -> int:
+        """
+        Values the items shared by every rucksack in each group of group_size elves
 
-        if sub_list:
-            elf_list.append(sub_list)
+        Notes
+        ------
+        With sliding set every run of group_size consecutive elves is a group, rather than each elf belonging to one.
+        """
+        _, rucksack_masks = self.parsed
+        if self.engine == "numpy":
+            import numpy as np
+            from _vectorized_rucksacks import group_masks, priority_total
 
-        return elf_list
+            rucksacks = np.frombuffer(rucksack_masks, dtype=np.uint64)
+            return priority_total(group_masks(rucksacks, group_size, sliding))
 
-    @staticmethod
-    def find_intersection(list_of_rucksacks: List[str]) -> set:
-        """Finds common element in list of given rucksacks"""
-        set_list = [set(i) for i in list_of_rucksacks]
-        intersection = set.intersection(*set_list)
-        return intersection
+        groups = self.group_elves(rucksack_masks, group_size, sliding)
+        return sum(self.mask_priority(reduce(and_, group)) for group in groups)
 
-    def find_and_value_occurrences(self, common_elements: set) -> List[int]:
+    @classmethod
+    def encode_items(cls, items: str) -> int:
         """
-        Uses the known common items and the priority_dict to determine a score value.
+        Encodes a collection of items as a 52 bit mask, bit n set if the item with priority n + 1 is present
 
-        Returns a list in case of multiple common elements
+        Notes
+        ------
+        Common items are then a single AND of masks, and their priorities are read back from the bit positions.
         """
-
-        return [self.priority_dict.get(i) for i in common_elements]
+        # Each item's bit is a distinct power of two, so summing the bits of the unique items is the same as ORing them
+        return sum(map(cls._ITEM_BITS.__getitem__, set(items)))
 
     @staticmethod
-    def _calc_value(value_list: List[int]) -> None:
-        """Sums up the values in the list of dicts"""
-        print(sum(value_list))
+    def mask_priority(mask: int) -> int:
+        """Sums the priorities of every item in a mask, almost always just the one"""
+        if not mask & (mask - 1):
+            return mask.bit_length()
+
+        total = 0
+        while mask:
+            lowest_item = mask & -mask
+            total += lowest_item.bit_length()
+            mask ^= lowest_item
+
+        return total
 
     @staticmethod
-    def _priority() -> dict:
-        all_chars = string.ascii_lowercase + string.ascii_uppercase
-        priority_dict = {}
-        for e, i in enumerate(all_chars, start=1):
-            priority_dict[i] = e
+    def group_elves(raw_data: Iterable[T], group_size: int = 3, sliding: bool = False) -> Iterator[List[T]]:
+        """
+        Groups up the rows into groups of group_size, yielding each group as soon as it is complete
+
+        Notes
+        ------
+        With sliding set every full window of group_size consecutive rows is yielded, otherwise the rows are split
+        into distinct groups and a short last group is yielded for any rows left over.
+        """
+        if group_size < 1:
+            raise ValueError(f"Groups need at least one rucksack, got {group_size}")
+
+        if sliding:
+            window = deque(maxlen=group_size)
+            for rucksack in raw_data:
+                window.append(rucksack)
+                if len(window) == group_size:
+                    yield list(window)
 
-        return priority_dict
+            return
+
+        sub_list = []
+        for e, rucksack in enumerate(raw_data, start=1):
+            sub_list.append(rucksack)
+            if e % group_size == 0:
+                yield sub_list
+                sub_list = []
+
+        if sub_list:
+            yield sub_list
 
 
 if __name__ == "__main__":
-    RucksackSorter()
+    RucksackSorter().main()
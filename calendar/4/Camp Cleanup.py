@@ -1,76 +1,153 @@
 """https://adventofcode.com/2022/day/4"""
+from array import array
 from calendar import AdventOfCode
-from typing import List, Tuple
+from typing import Iterable, Iterator, List, Tuple
 
 
 class CampCleanup(AdventOfCode):
     """Finds overlaps between lists of ints"""
 
-    def __init__(self):
-        super().__init__()
+    parser_version = 3
+    engines = ("python", "numpy")
+    raw_engines = ("numpy",)
+
+    def solve_part1(self) -> int:
+        """Number of pairs where one section assignment fully contains the other"""
+        return self.task_one()
+
+    def solve_part2(self) -> int:
+        """Number of pairs whose section assignments overlap at all"""
+        return self.task_two()
+
+    def parse(self) -> Tuple[array, array, array, array]:
+        """
+        Parses every pair once into four columns of section endpoints: start1, end1, start2, end2
+
+        Notes
+        ------
+        Both engines give the same int64 arrays, so the parse cache is shared between them and both parts read the
+        same columns rather than parsing the rows again.
+        """
+        if self.engine == "numpy":
+            with self.raw_input() as buffer:
+                if buffer is not None:
+                    from _vectorized_sections import section_columns
+
+                    columns = section_columns(buffer)
+                    if columns is not None:
+                        return tuple(array("q", column.tobytes()) for column in columns)
+
+            self.reporter.info("Assignments are not all laid out as a-b,c-d rows, parsing them row by row")
+
+        columns = tuple(array("q") for _ in range(4))
+        start_1, end_1, start_2, end_2 = (column.append for column in columns)
+        for (first_1, last_1), (first_2, last_2) in self.section_expander(self.text_file):
+            start_1(first_1)
+            end_1(last_1)
+            start_2(first_2)
+            end_2(last_2)
+
+        return columns
+
+    def task_one(self) -> int:
+        """Finding full overlaps between sections"""
+        if self.engine == "numpy" and not self.reporter.tracing:
+            from _vectorized_sections import full_overlap_count
 
-        self.task_one()
-        self.task_two()
+            overlap_count = full_overlap_count(self._numpy_columns())
+            self.reporter.info("There were %s total full overlaps", overlap_count)
+            return overlap_count
 
-    def task_one(self):
-        """Finding full overlaps between sections"""
-        expanded_elf_pairs = self.section_expander(self.text_file)
-        self.find_full_overlaps(expanded_elf_pairs)
+        return self.find_full_overlaps(self.section_pairs())
 
-    def task_two(self):
+    def task_two(self) -> int:
         """Finding partial overlaps between sections"""
-        expanded_elf_pairs = self.section_expander(self.text_file)
-        self.find_partial_overlaps(expanded_elf_pairs)
+        if self.engine == "numpy" and not self.reporter.tracing:
+            from _vectorized_sections import partial_overlap_count
+
+            overlap_count = partial_overlap_count(self._numpy_columns())
+            self.reporter.info("There were %s total partial overlaps", overlap_count)
+            return overlap_count
+
+        return self.find_partial_overlaps(self.section_pairs())
+
+    def section_pairs(self) -> Iterator[Tuple[Tuple[int, int], Tuple[int, int]]]:
+        """The parsed pairs, as the (first, last) section of each elf"""
+        start_1, end_1, start_2, end_2 = self.parsed
+        return zip(zip(start_1, end_1), zip(start_2, end_2))
+
+    def section_index(self):
+        """
+        An interval index over every elf's assignment, for which assignments cover a section, how many distinct
+        sections are covered and the busiest section
+
+        Notes
+        ------
+        Assignment 2 * n is the first elf of pair n and 2 * n + 1 the second, see SectionIndex for the queries.
+        """
+        from _section_index import SectionIndex
+
+        return SectionIndex.from_pairs(*self.parsed)
+
+    def section_expander(self, input_data: Iterable[str]) -> Iterator[List[Tuple[int, int]]]:
+        """
+        Converts the input rows to the (first, last) section of each elf in the pair, one elf pair at a time
 
-    def section_expander(self, input_data: List[str]) -> list[list[list[int]]]:
-        """Converts the input list from strings to lists of ints"""
-        expanded_list = []
+        Notes
+        ------
+        Only the endpoints are kept, so a pair costs the same however many sections the elves are assigned.
+        """
         for row in input_data:
             elf_pairs = row.split(",")
             elf_pair_list = []
             for elf in elf_pairs:
                 areas = elf.split("-")
-                min_area, max_area = self._find_min_max(areas)
-                filled_in_area_list = self._fill_in_ints(min_area, max_area)
+                elf_pair_list.append(self._find_min_max(areas))
 
-                elf_pair_list.append(filled_in_area_list)
-            expanded_list.append(elf_pair_list)
+            yield elf_pair_list
 
-        return expanded_list
-
-    @staticmethod
-    def find_full_overlaps(expanded_list: list):
+    def find_full_overlaps(self, expanded_list: Iterable[List[Tuple[int, int]]]) -> int:
         """Checks if a section pairing FULLY contains the other"""
+        tracing = self.reporter.tracing
         overlap_count = 0
-        for elf_pairing in expanded_list:
-            elf_set_1 = set(elf_pairing[0])
-            elf_set_2 = set(elf_pairing[1])
+        for (start_1, end_1), (start_2, end_2) in expanded_list:
 
-            if elf_set_1.issubset(elf_set_2):
-                print(f"Elf1 is subset of Elf2", min(elf_set_1), max(elf_set_1), "--", min(elf_set_2), max(elf_set_2))
+            if start_2 <= start_1 and end_1 <= end_2:
+                if tracing:
+                    self._trace_pairing("Elf1 is subset of Elf2", start_1, end_1, start_2, end_2)
                 overlap_count += 1
 
-            elif elf_set_1.issuperset(elf_set_2):
-                print(f"Elf1 is superset of Elf2", min(elf_set_1), max(elf_set_1), "--", min(elf_set_2), max(elf_set_2))
+            elif start_1 <= start_2 and end_2 <= end_1:
+                if tracing:
+                    self._trace_pairing("Elf1 is superset of Elf2", start_1, end_1, start_2, end_2)
                 overlap_count += 1
 
-            else:
-                pass
-
-        print(f"There were {overlap_count} total full overlaps")
+        self.reporter.info("There were %s total full overlaps", overlap_count)
+        return overlap_count
 
-    @staticmethod
-    def find_partial_overlaps(expanded_list: list) -> None:
+    def find_partial_overlaps(self, expanded_list: Iterable[List[Tuple[int, int]]]) -> int:
         """Checks if there are ANY overlaps in the sections"""
+        tracing = self.reporter.tracing
         overlap_count = 0
-        for elf_pairing in expanded_list:
-            elf_pairing_set_list = list(map(set, elf_pairing))
-            overlap_set = set.intersection(*elf_pairing_set_list)
-            if overlap_set:
-                print(f"Overlaps found: {min(overlap_set)} - {max(overlap_set)}")
+        for (start_1, end_1), (start_2, end_2) in expanded_list:
+            overlap_start = max(start_1, start_2)
+            overlap_end = min(end_1, end_2)
+            if overlap_start <= overlap_end:
+                if tracing:
+                    self.reporter.trace("Overlaps found: %s - %s", overlap_start, overlap_end)
                 overlap_count += 1
 
-        print(f"There were {overlap_count} total partial overlaps")
+        self.reporter.info("There were %s total partial overlaps", overlap_count)
+        return overlap_count
+
+    def _numpy_columns(self):
+        """The parsed columns viewed as NumPy arrays, without copying"""
+        import numpy as np
+
+        return tuple(np.frombuffer(column, dtype=np.int64) for column in self.parsed)
+
+    def _trace_pairing(self, message: str, start_1: int, end_1: int, start_2: int, end_2: int) -> None:
+        self.reporter.trace("%s %s %s -- %s %s", message, start_1, end_1, start_2, end_2)
 
     @staticmethod
     def _find_min_max(areas: List[str]) -> Tuple[int, int]:
@@ -80,12 +157,6 @@ class CampCleanup(AdventOfCode):
         max_area = max(areas)
         return min_area, max_area
 
-    @staticmethod
-    def _fill_in_ints(min_val: int, max_val: int) -> List[int]:
-        """Using 2 int values, forms a list with all values between and including them"""
-        lst = [i for i in range(min_val, max_val + 1)]
-        return lst
-
 
 if __name__ == "__main__":
-    CampCleanup()
+    CampCleanup().main()
@@ -0,0 +1,172 @@
+"""
+Interval index over the section assignments, for questions about which sections the elves cover
+
+Assignments are numbered in input order, assignment 2 * n being the first elf of pair n and 2 * n + 1 the second.
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+
+class SectionIndex:
+    """
+    Answers point, range and coverage queries over every section assignment without expanding any of them
+
+    Notes
+    ------
+    The assignments are sorted by first section, with a max tree over their last sections so the assignments
+    touching a point or range are found in O(log n + k) for k matches. Sorted first and last sections answer how
+    many assignments cover a section in O(log n), and the merged union of all assignments answers how many distinct
+    sections are covered in O(log n). Batches of point queries are sorted once and swept against the endpoints.
+    """
+
+    def __init__(self, starts: Sequence[int], ends: Sequence[int]):
+        if len(starts) != len(ends):
+            raise ValueError(f"Every assignment needs a first and last section, got {len(starts)} and {len(ends)}")
+
+        order = sorted(range(len(starts)), key=starts.__getitem__)
+        self.order = array("q", order)
+        self.starts = array("q", map(starts.__getitem__, order))
+        self.ends = array("q", map(ends.__getitem__, order))
+        self.sorted_ends = array("q", sorted(ends))
+        self._max_ends = self._build_max_tree(self.ends)
+        self.union_starts, self.union_ends, self._union_sizes = self._build_union(self.starts, self.ends)
+
+    @classmethod
+    def from_pairs(cls, start_1: Sequence[int], end_1: Sequence[int], start_2: Sequence[int], end_2: Sequence[int]):
+        """Indexes both elves of every pair, from the four parsed columns"""
+        starts, ends = array("q"), array("q")
+        for pair_starts, pair_ends in zip(zip(start_1, start_2), zip(end_1, end_2)):
+            starts.extend(pair_starts)
+            ends.extend(pair_ends)
+
+        return cls(starts, ends)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def assignments_covering(self, section: int) -> List[int]:
+        """The assignments that include the section, in input order"""
+        return self.assignments_overlapping(section, section)
+
+    def assignments_overlapping(self, first: int, last: int) -> List[int]:
+        """The assignments that include any section from first to last, in input order"""
+        if first > last:
+            return []
+
+        # Only assignments starting by last can overlap, of those the max tree skips any ending before first
+        candidates = bisect_right(self.starts, last)
+        leaves = len(self._max_ends) // 2
+        found = []
+        nodes = [(1, 0, leaves)]
+        while nodes:
+            node, low, high = nodes.pop()
+            if low >= candidates or self._max_ends[node] < first:
+                continue
+
+            if node >= leaves:
+                found.append(self.order[low])
+                continue
+
+            middle = (low + high) // 2
+            nodes.append((2 * node + 1, middle, high))
+            nodes.append((2 * node, low, middle))
+
+        return sorted(found)
+
+    def coverage_at(self, section: int) -> int:
+        """How many assignments include the section"""
+        return bisect_right(self.starts, section) - bisect_left(self.sorted_ends, section)
+
+    def coverage_at_many(self, sections: Iterable[int]) -> List[int]:
+        """How many assignments include each section, in the order given, in one sweep over the sorted sections"""
+        sections = list(sections)
+        coverage = [0] * len(sections)
+        started = ended = 0
+        for query in sorted(range(len(sections)), key=sections.__getitem__):
+            section = sections[query]
+            while started < len(self.starts) and self.starts[started] <= section:
+                started += 1
+
+            while ended < len(self.sorted_ends) and self.sorted_ends[ended] < section:
+                ended += 1
+
+            coverage[query] = started - ended
+
+        return coverage
+
+    def assignments_covering_many(self, sections: Iterable[int]) -> List[List[int]]:
+        """The assignments that include each section, in the order given"""
+        return [self.assignments_covering(section) for section in sections]
+
+    def covered_sections(self, first: Optional[int] = None, last: Optional[int] = None) -> int:
+        """How many distinct sections at least one assignment includes, only counting from first to last if given"""
+        if not self.union_starts:
+            return 0
+
+        if first is None:
+            first = self.union_starts[0]
+
+        if last is None:
+            last = self.union_ends[-1]
+
+        if first > last:
+            return 0
+
+        # Whole union runs between the run holding first and the run holding last, then trim the two ends
+        first_run = bisect_left(self.union_ends, first)
+        last_run = bisect_right(self.union_starts, last) - 1
+        if first_run > last_run:
+            return 0
+
+        covered = self._union_sizes[last_run + 1] - self._union_sizes[first_run]
+        covered -= max(0, first - self.union_starts[first_run])
+        covered -= max(0, self.union_ends[last_run] - last)
+        return covered
+
+    def max_coverage(self) -> Tuple[int, Optional[int]]:
+        """The most assignments including any one section, and the lowest section with that many"""
+        best_coverage, best_section = 0, None
+        ended = 0
+        for started, section in enumerate(self.starts, start=1):
+            # Coverage only rises where an assignment starts, so those are the only sections worth checking
+            if started < len(self.starts) and self.starts[started] == section:
+                continue
+
+            while self.sorted_ends[ended] < section:
+                ended += 1
+
+            if started - ended > best_coverage:
+                best_coverage, best_section = started - ended, section
+
+        return best_coverage, best_section
+
+    @staticmethod
+    def _build_max_tree(ends: Sequence[int]) -> array:
+        """Max tree over the last sections, leaves padded to a power of two with a value no query can reach"""
+        leaves = 1
+        while leaves < len(ends):
+            leaves *= 2
+
+        tree = array("q", [-(2**63)]) * (2 * leaves)
+        tree[leaves : leaves + len(ends)] = array("q", ends)
+        for node in range(leaves - 1, 0, -1):
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+
+        return tree
+
+    @staticmethod
+    def _build_union(starts: Sequence[int], ends: Sequence[int]) -> Tuple[array, array, array]:
+        """Merges the assignments, sorted by first section, into disjoint runs plus a running count of their sections"""
+        union_starts, union_ends = array("q"), array("q")
+        for start, end in zip(starts, ends):
+            # Adjacent runs are merged too, it makes no difference to the counts and keeps the runs fewer
+            if union_ends and start <= union_ends[-1] + 1:
+                union_ends[-1] = max(union_ends[-1], end)
+            else:
+                union_starts.append(start)
+                union_ends.append(end)
+
+        sizes = (end - start + 1 for start, end in zip(union_starts, union_ends))
+        return union_starts, union_ends, array("q", accumulate(sizes, initial=0))
@@ -0,0 +1,94 @@
+"""NumPy engine for the section assignments, parsing the raw input straight into endpoint columns"""
+from calendar import AdventOfCode
+from typing import Optional, Tuple
+
+import numpy as np
+
+ZERO = ord("0")
+NEWLINE = ord("\n")
+CARRIAGE_RETURN = ord("\r")
+
+# The byte following each of the four numbers on a row
+ROW_SEPARATORS = np.frombuffer(b"-,-\n", dtype=np.uint8)
+# Longest number that fits an int64 whatever its digits
+MAX_DIGITS = 18
+
+Columns = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+def section_columns(buffer, block_size: int = 4 * 1024 * 1024) -> Optional[Columns]:
+    """
+    The (start1, end1, start2, end2) int64 columns of every pair, None if the rows are not all "<a>-<b>,<c>-<d>"
+
+    Notes
+    ------
+    Numbers are found as runs of digit bytes and valued with one add.reduceat of digit * 10^place over the runs, so
+    no row is ever split into Python strings. Blocks of the input are parsed one at a time, so the only memory that
+    grows with the input is the four columns. As with the line by line parse each elf's endpoints are put in order.
+    """
+    blocks = []
+    for block in AdventOfCode.line_blocks(buffer, block_size):
+        numbers = _parse_block(block)
+        del block
+        if numbers is None:
+            return None
+
+        blocks.append(numbers)
+
+    numbers = np.concatenate(blocks) if blocks else np.zeros((0, 4), dtype=np.int64)
+    first_1, last_1, first_2, last_2 = numbers.T
+    return (
+        np.minimum(first_1, last_1),
+        np.maximum(first_1, last_1),
+        np.minimum(first_2, last_2),
+        np.maximum(first_2, last_2),
+    )
+
+
+def _parse_block(block) -> Optional[np.ndarray]:
+    """The (n, 4) numbers of one block of whole rows, None if any row is malformed"""
+    raw = np.frombuffer(block, dtype=np.uint8)
+    # Windows line endings only add a \r before each line break, drop those before checking the layout
+    carriage_returns = np.flatnonzero(raw[:-1] == CARRIAGE_RETURN)
+    if len(carriage_returns):
+        raw = np.delete(raw, carriage_returns[raw[carriage_returns + 1] == NEWLINE])
+
+    digits = raw - np.uint8(ZERO)
+    is_digit = digits < 10
+    separators = raw[~is_digit]
+    if raw[-1] != NEWLINE:
+        separators = np.append(separators, np.uint8(NEWLINE))
+
+    run_starts = np.flatnonzero(is_digit & ~np.concatenate(([False], is_digit[:-1])))
+    # Digit runs and separators have to alternate exactly, starting with a digit, for every row to be 4 numbers
+    if (
+        not is_digit[0]
+        or len(separators) % len(ROW_SEPARATORS)
+        or len(run_starts) != len(separators)
+        or (separators.reshape(-1, len(ROW_SEPARATORS)) != ROW_SEPARATORS).any()
+    ):
+        return None
+
+    # Positions of each run once the separators are taken out
+    run_offsets = run_starts - np.arange(len(run_starts))
+    digits = digits[is_digit].astype(np.int64)
+    run_lengths = np.diff(np.append(run_offsets, len(digits)))
+    if run_lengths.max() > MAX_DIGITS:
+        return None
+
+    # Each digit is worth 10 ^ (how many digits follow it in its number)
+    run_ends = np.repeat(run_offsets + run_lengths, run_lengths)
+    place_values = np.power(np.int64(10), run_ends - 1 - np.arange(len(digits)))
+    return np.add.reduceat(digits * place_values, run_offsets).reshape(-1, len(ROW_SEPARATORS))
+
+
+def full_overlap_count(columns: Columns) -> int:
+    """How many pairs have one elf's sections fully containing the other's"""
+    start_1, end_1, start_2, end_2 = columns
+    return int((((start_2 <= start_1) & (end_1 <= end_2)) | ((start_1 <= start_2) & (end_2 <= end_1))).sum())
+
+
+def partial_overlap_count(columns: Columns) -> int:
+    """How many pairs share at least one section"""
+    start_1, end_1, start_2, end_2 = columns
+    return int((np.maximum(start_1, start_2) <= np.minimum(end_1, end_2)).sum())
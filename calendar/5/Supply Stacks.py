@@ -1,75 +1,143 @@
 """https://adventofcode.com/2022/day/5"""
 import re
+from array import array
 from calendar import AdventOfCode
-from typing import List, Tuple
+from typing import Dict, Iterator, List, Tuple
+
+MOVE_PATTERN = re.compile(r"move (\d+) from (\d+) to (\d+)")
 
 
 class SupplyStacks(AdventOfCode):
     """Moves crates onto stacks using some instructions"""
 
-    def __init__(self):
-        super().__init__(strip_rows=False)
+    strip_rows = False
+    parser_version = 3
+    engines = ("python", "rope")
+
+    _crane_stacks: Tuple[Dict[int, List[str]], Dict[int, List[str]]] = None
+
+    def parse(self) -> Tuple[Dict[int, List[str]], array]:
+        """
+        Parses the starting crate stacks and compiles the moves into one flat array of (quantity, from, to) ints
+        """
+        parsed_crate_list = self._parse_starting_stack_positions()
+        stack_dict = self._convert_to_stack_dict(parsed_crate_list)
+        move_program = array("q")
+        for move in self.get_moves_list():
+            move_program.extend(move)
+
+        return stack_dict, move_program
+
+    def solve_part1(self) -> str:
+        """Top crate of each stack when crates are moved one at a time"""
+        return self.task()
 
-        self.task()
-        self.task(multi_move=True)
+    def solve_part2(self) -> str:
+        """Top crate of each stack when crates are moved several at once"""
+        return self.task(multi_move=True)
 
-    def task(self, multi_move: bool = False) -> None:
-        """Finds what the top crate is per stack if one crate is moved at a time"""
-        self._setup()
-        move_list = self.get_moves_list()
+    def task(self, multi_move: bool = False) -> str:
+        """Finds what the top crate is per stack, moving one crate at a time unless multi_move is set"""
+        if self.reporter.tracing:
+            self._setup()
+            for i in self.moves():
+                self.apply_move(*i, multi_move=multi_move)
 
-        for i in move_list:
-            self.apply_move(*i, multi_move=multi_move)
+        else:
+            self.stack_dict = self.run_cranes()[multi_move]
 
         top_stack_string = ""
         for stack_num, stack in self.stack_dict.items():
-            print(f"{stack_num} - Top Crate: {stack[-1]}")
+            self.reporter.info("%s - Top Crate: %s", stack_num, stack[-1])
             top_stack_string += stack[-1][1]
 
-        print(top_stack_string)
-
-    def get_moves_list(self):
+        return top_stack_string
+
+    def run_cranes(self) -> Tuple[Dict[int, List[str]], Dict[int, List[str]]]:
+        """
+        Runs the move program once with both cranes, giving the final stacks of the CrateMover 9000 then the 9001
+
+        Notes
+        ------
+        Both sets of stacks are moved in the same loop, so the program is only read once, and the result is kept
+        for whichever part asks second. The rope engine keeps the stacks as CrateStack runs, so a move costs the runs
+        it touches rather than the crates it moves.
+        """
+        if self._crane_stacks is not None:
+            return self._crane_stacks
+
+        starting_stacks, move_program = self.parsed
+        program = iter(move_program)
+        if self.engine == "rope":
+            from _crate_rope import CrateStack
+
+            stacks_9000 = {stack_num: CrateStack(stack) for stack_num, stack in starting_stacks.items()}
+            stacks_9001 = {stack_num: CrateStack(stack) for stack_num, stack in starting_stacks.items()}
+            for quantity, origin_stack, dest_stack in zip(program, program, program):
+                stacks_9000[origin_stack].move_to(stacks_9000[dest_stack], quantity, reverse=True)
+                stacks_9001[origin_stack].move_to(stacks_9001[dest_stack], quantity)
+
+            self._crane_stacks = stacks_9000, stacks_9001
+            return self._crane_stacks
+
+        stacks_9000 = {stack_num: list(stack) for stack_num, stack in starting_stacks.items()}
+        stacks_9001 = {stack_num: list(stack) for stack_num, stack in starting_stacks.items()}
+        for quantity, origin_stack, dest_stack in zip(program, program, program):
+            origin = stacks_9000[origin_stack]
+            split = max(len(origin) - quantity, 0)
+            stacks_9000[dest_stack].extend(reversed(origin[split:]))
+            del origin[split:]
+
+            origin = stacks_9001[origin_stack]
+            split = max(len(origin) - quantity, 0)
+            stacks_9001[dest_stack].extend(origin[split:])
+            del origin[split:]
+
+        self._crane_stacks = stacks_9000, stacks_9001
+        return self._crane_stacks
+
+    def moves(self) -> Iterator[Tuple[int, int, int]]:
+        """The parsed moves, as (quantity, from, to) instructions"""
+        _, move_program = self.parsed
+        program = iter(move_program)
+        return zip(program, program, program)
+
+    def get_moves_list(self) -> Iterator[Tuple[int, int, int]]:
         """Iterates over rows with "move" in them and parses the individual instructions"""
-        move_list = []
         for i in self.text_file:
             if "move" in i:
-                quantity, origin_stack, dest_stack = self._parse_move_instructions(i)
-                move_list.append([quantity, origin_stack, dest_stack])
-
-        return move_list
+                yield self._parse_move_instructions(i)
 
     def apply_move(self, quantity: int, origin_stack: int, dest_stack: int, multi_move: bool = False) -> None:
-        """Takes an instruction and moves n many crates"""
-        print(f"Need to move {quantity} crates from {origin_stack} to {dest_stack}")
-        if multi_move:
-            self._move_crates(quantity, origin_stack, dest_stack)
-
-        else:
-            for i in range(quantity):
-                self._move_crates(1, origin_stack, dest_stack)
-
-    def _move_crates(self, move_quantity: int, origin_stack: int, dest_stack: int) -> None:
+        """
+        Takes an instruction and moves n many crates
+
+        Notes
+        ------
+        Either crane is a single slice transfer, moving crates one at a time (the CrateMover 9000) just lands the
+        slice on the new stack in reverse order.
+        """
+        self.reporter.trace("Need to move %s crates from %s to %s", quantity, origin_stack, dest_stack)
+        self._move_crates(quantity, origin_stack, dest_stack, reverse=not multi_move)
+
+    def _move_crates(self, move_quantity: int, origin_stack: int, dest_stack: int, reverse: bool = False) -> None:
         crate_list = self._get_crates(origin_stack, move_quantity)
-        print(f"Moving {crate_list} from {origin_stack} to {dest_stack}")
+        if reverse:
+            crate_list.reverse()
+
+        self.reporter.trace("Moving %s from %s to %s", crate_list, origin_stack, dest_stack)
         self._remove_crate(origin_stack, move_quantity)
         self._add_crate(dest_stack, crate_list)
 
     def _get_crates(self, stack_num: int, num_crates: int) -> List[str]:
-        """Gets the top most crate from a stack"""
-        try:
-            crate = self.stack_dict[stack_num][num_crates * -1 :]
-            if isinstance(crate, str):
-                crate = [crate]
-
-            return crate
-
-        except IndexError:
-            print("Stack is empty")
-            raise
+        """Gets the top most crates from a stack, as many as there are if it holds fewer than num_crates"""
+        stack = self.stack_dict[stack_num]
+        return stack[max(len(stack) - num_crates, 0) :]
 
     def _remove_crate(self, stack_num: int, quantity: int) -> None:
         """Removes n many crates from a stack"""
-        del self.stack_dict[stack_num][quantity * -1 :]
+        stack = self.stack_dict[stack_num]
+        del stack[max(len(stack) - quantity, 0) :]
 
     def _add_crate(self, stack_num: int, crate: list) -> None:
         """Extends a stack list by a list of crates"""
@@ -78,15 +146,15 @@ class SupplyStacks(AdventOfCode):
     @staticmethod
     def _parse_move_instructions(move_row: str) -> Tuple[int, int, int]:
         """Extracts the number of crates to move and the stack numbers using regex"""
-        pattern = r"move (\d+) from (\d+) to (\d+)"
-        match = re.match(pattern, move_row)
+        match = MOVE_PATTERN.match(move_row)
         if match is not None:
             quantity, origin_stack, dest_stack = list(map(int, match.groups()))
             return quantity, origin_stack, dest_stack
 
     def _setup(self) -> None:
-        parsed_crate_list = self._parse_starting_stack_positions()
-        self.stack_dict = self._convert_to_stack_dict(parsed_crate_list)
+        """Resets the working stacks to a fresh copy of the parsed starting positions"""
+        starting_stacks, _ = self.parsed
+        self.stack_dict = {stack_num: list(stack) for stack_num, stack in starting_stacks.items()}
 
     def _parse_starting_stack_positions(self) -> List[List[str]]:
         """Extracts the starting position of all crates on each stack"""
@@ -112,4 +180,4 @@ class SupplyStacks(AdventOfCode):
 
 
 if __name__ == "__main__":
-    SupplyStacks()
+    SupplyStacks().main()
@@ -0,0 +1,135 @@
+"""
+Crate stacks stored as runs of crates rather than one crate per list slot, for stacks of millions of crates
+
+A move hands whole runs from one stack to the other, so it costs the number of runs touched rather than the number of
+crates. Moving crates one at a time only reverses their order, which each run records as a flag instead of copying.
+"""
+from typing import Iterable, Iterator, List, Sequence
+
+# Runs at the top of a stack are merged while their crates fit in this many, so lots of small moves cannot leave a
+# stack split into a run per crate
+MERGE_LIMIT = 64
+
+
+class _Run:
+    """A slice of a crate list, read bottom to top, or top to bottom if reversed"""
+
+    __slots__ = ("crates", "start", "stop", "reversed")
+
+    def __init__(self, crates: Sequence[str], start: int, stop: int, is_reversed: bool = False):
+        self.crates = crates
+        self.start = start
+        self.stop = stop
+        self.reversed = is_reversed
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def to_list(self) -> List[str]:
+        """The crates of the run, bottom first, as one slice copy"""
+        crates = self.crates[self.start : self.stop]
+        return crates[::-1] if self.reversed else crates
+
+    def crate(self, position: int) -> str:
+        """The crate position places up from the bottom of the run"""
+        return self.crates[self.stop - 1 - position if self.reversed else self.start + position]
+
+    def split(self, count: int) -> "_Run":
+        """Cuts the top count crates off into a new run, leaving the rest in this one"""
+        if self.reversed:
+            top = _Run(self.crates, self.start, self.start + count, True)
+            self.start += count
+        else:
+            top = _Run(self.crates, self.stop - count, self.stop)
+            self.stop -= count
+
+        return top
+
+
+class CrateStack:
+    """
+    A stack of crates that moves contiguous crates as whole runs
+
+    Notes
+    ------
+    The crate lists behind the runs are never changed once created, so runs can be cut and handed between stacks
+    freely. A move splits at most one run and hands over the rest untouched, turning them over for the CrateMover
+    9000 by flipping their reversed flags. Indexing and iterating read through the runs, bottom crate first, like the
+    plain list stacks.
+    """
+
+    __slots__ = ("_runs", "_size")
+
+    def __init__(self, crates: Iterable[str] = ()):
+        crates = list(crates)
+        self._runs: List[_Run] = [_Run(crates, 0, len(crates))] if crates else []
+        self._size = len(crates)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[str]:
+        for run in self._runs:
+            yield from run.to_list()
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += self._size
+
+        if not 0 <= index < self._size:
+            raise IndexError("Stack index out of range")
+
+        # Answers are read from the top, so the runs are searched from that end
+        above = self._size
+        for run in reversed(self._runs):
+            above -= len(run)
+            if index >= above:
+                return run.crate(index - above)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+    @property
+    def runs(self) -> int:
+        """How many runs the crates are currently split into"""
+        return len(self._runs)
+
+    def take(self, quantity: int) -> List[_Run]:
+        """Removes the top quantity crates, or every crate if there are fewer, as runs in bottom to top order"""
+        taken = []
+        remaining = min(quantity, self._size)
+        self._size -= remaining
+        while remaining:
+            run = self._runs[-1]
+            if len(run) > remaining:
+                taken.append(run.split(remaining))
+                break
+
+            taken.append(self._runs.pop())
+            remaining -= len(run)
+
+        taken.reverse()
+        return taken
+
+    def put(self, runs: List[_Run], reverse: bool = False) -> None:
+        """Places runs (bottom to top order) on top of the stack, turning the whole lot over if reverse is set"""
+        if reverse:
+            runs.reverse()
+            for run in runs:
+                run.reversed = not run.reversed
+
+        self._runs.extend(runs)
+        self._size += sum(map(len, runs))
+        self._merge_top()
+
+    def move_to(self, dest: "CrateStack", quantity: int, reverse: bool = False) -> None:
+        """Moves the top quantity crates onto dest, one at a time (landing reversed) if reverse is set"""
+        dest.put(self.take(quantity), reverse)
+
+    def _merge_top(self) -> None:
+        """Copies the top two runs into one while they are small enough, undoing the fragmentation of small moves"""
+        runs = self._runs
+        while len(runs) > 1 and len(runs[-1]) + len(runs[-2]) <= MERGE_LIMIT:
+            top = runs.pop()
+            crates = runs.pop().to_list() + top.to_list()
+            runs.append(_Run(crates, 0, len(crates)))
@@ -1,46 +1,69 @@
 """https://adventofcode.com/2022/day/6"""
 from calendar import AdventOfCode
-from typing import List
+from typing import BinaryIO, Iterable, Iterator, Union
 
 
 class TuningTrouble(AdventOfCode):
     """Crawling through a long string to detect a unique set of characters"""
 
-    def __init__(self):
-        super().__init__()
+    parser_version = 2
+
+    def __init__(self, text_file: Iterable[str] = None, lazy: bool = None):
+        super().__init__(text_file, lazy)
 
         self.packet_num_chars = 4
         self.message_num_chars = 14
 
-        self.task()
+    def parse(self) -> bytes:
+        """The puzzle input is a single data stream on the first row, encoded once so both parts share the bytes"""
+        return next(iter(self.text_file)).encode()
 
-    def task(self):
-        """Locating specific strings of lengths 4 and 14"""
-        row: str
-        for row in self.text_file:
-            market_pos = self.locate_markers(row, self.packet_num_chars)
-            print(f"There are {market_pos} chars before first market detected")
+    def solve_part1(self) -> int:
+        """Number of chars processed before the first start-of-packet marker is detected"""
+        return self.locate_markers(self.parsed, self.packet_num_chars)
+
+    def solve_part2(self) -> int:
+        """Number of chars processed before the first start-of-message marker is detected"""
+        return self.locate_markers(self.parsed, self.message_num_chars)
 
-            market_pos = self.locate_markers(row, self.message_num_chars)
-            print(f"There are {market_pos} chars before first message detected")
+    def main(self) -> None:
+        """Locating specific strings of lengths 4 and 14"""
+        self.reporter.result("There are %s chars before first market detected", self.solve_part1())
+        self.reporter.result("There are %s chars before first message detected", self.solve_part2())
 
-    def locate_markers(self, data_stream: str, num_unique_chars_to_find: int) -> int:
+    def locate_markers(self, data_stream: Union[str, bytes], num_unique_chars_to_find: int) -> int:
         """Iterates through the stream and locates unique chars of a given length"""
+        if isinstance(data_stream, str):
+            data_stream = data_stream.encode()
+
+        windows = self._split_data_stream_to_chunks(data_stream, num_unique_chars_to_find)
+        return self._first_unique_window_end(windows, num_unique_chars_to_find)
+
+    def locate_markers_in_stream(self, data_stream: BinaryIO, num_unique_chars_to_find: int) -> int:
+        """
+        Same as locate_markers, but reads the data stream from a binary file object block by block
 
-        marker_list = []
-        for s in self._split_data_stream_to_chunks(data_stream, num_unique_chars_to_find):
-            if len(set(s)) == num_unique_chars_to_find:
-                marker_list.append(s)
+        Notes
+        ------
+        Only for library callers with streams too big to read in one go, eg locate_markers_in_stream(open(path, "rb"),
+        14). main and the solve methods work from the parsed bytes.
+        """
+        windows = self.stream_chunker(data_stream, num_unique_chars_to_find, distinct_groups=False)
+        return self._first_unique_window_end(windows, num_unique_chars_to_find)
 
-        first_marker_pos = data_stream.find("".join(marker_list[0]))
-        return first_marker_pos + num_unique_chars_to_find
+    @staticmethod
+    def _first_unique_window_end(windows: Iterable[memoryview], num_unique_chars_to_find: int) -> int:
+        """Stops at the first window made up of unique chars and returns how many chars have been read by its end"""
+        for pos, window in enumerate(windows):
+            if len(set(window)) == num_unique_chars_to_find:
+                return pos + num_unique_chars_to_find
 
-    def _split_data_stream_to_chunks(self, data_stream: str, num_chars_to_group_to: int) -> List[str]:
-        """Converts the long data string to a list of strings, crawled forward one character at a time"""
+        raise ValueError(f"No run of {num_unique_chars_to_find} unique chars found in the data stream")
 
-        split_strings = list(self.chunker(data_stream, num_chars_to_group_to, distinct_groups=False))
-        return split_strings
+    def _split_data_stream_to_chunks(self, data_stream: bytes, num_chars_to_group_to: int) -> Iterator[memoryview]:
+        """Crawls forward through the data stream one character at a time, without copying any of the windows"""
+        return self.chunker(data_stream, num_chars_to_group_to, distinct_groups=False)
 
 
 if __name__ == "__main__":
-    TuningTrouble()
+    TuningTrouble().main()
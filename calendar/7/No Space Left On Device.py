@@ -3,37 +3,33 @@ from __future__ import annotations
 
 import re
 from calendar import AdventOfCode
-from pprint import pprint
-from typing import List, Optional
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+if TYPE_CHECKING:
+    from _file_system import DirObj
 
 
-class DirObj(BaseModel):
-    """Class to hold details for objects in a file system"""
+def __getattr__(name: str):
+    """Keeps DirObj importable from this module without importing pydantic up front"""
+    if name == "DirObj":
+        from _file_system import DirObj
 
-    name: str = Field(..., description="Object name")
-    type: str = Field(..., description="Object type, either dir or file")
-    size: int = Field(0, description="The total size of this file. 0 if it is a directory")
-    parent_dir: Optional[DirObj] = Field(None, description="The parent of this object")
-    child_objects: Optional[List[DirObj]] = Field([], description="Child objects if this is a dir")
+        return DirObj
 
-    dir_size: Optional[int] = Field(0, description="The total size in this directory. 0 if it is a file")
-
-    class Config:
-        validate_assignment = True
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class NoSpaceLeftOnDevice(AdventOfCode):
     """Using some overkill Pydantic models, the directory structure can be modelled as a nested hierarchy"""
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, text_file: Iterable[str] = None, lazy: bool = None):
+        super().__init__(text_file, lazy)
         self.cwd = "/"
         self.cd_patten = r"\$ cd (.*)"
 
-        self.root_object: DirObj = self._create_dir_obj("/", "dir")
-        self.current_obj: DirObj = self.root_object
+        # Built by parse, so a cached parse never has to model the file system
+        self.root_object: Optional[DirObj] = None
+        self.current_obj: Optional[DirObj] = None
 
         self.dir_size_list = []
         self.max_dir_size = 100_000
@@ -41,68 +37,111 @@ class NoSpaceLeftOnDevice(AdventOfCode):
         self.total_dir_size = 70_000_000
         self.update_size = 30_000_000
 
+    def parse(self) -> List[Tuple[str, int]]:
+        """Models the directory structure from the terminal output, returning the (name, size) of every directory"""
+        self.root_object = self._create_dir_obj("/", "dir")
+        self.current_obj = self.root_object
+        self.dir_size_list = []
+
         self.task()
+        return self.dir_size_list
+
+    def solve_part1(self) -> int:
+        """Sum of the sizes of all directories at or below the size threshold"""
+        return self.find_all_small_dirs()
+
+    def solve_part2(self) -> int:
+        """Size of the smallest directory that frees up enough space for the update"""
+        _, size = self.find_smallest_size_to_fit_update()
+        return size
 
     def task(self):
         """Task to find file and directory sizes, using a set of instructions to model the structure."""
 
-        row = self.text_file[0]
-        if "$ ls" in row:
-            print(f"Listing the contents of: {self._get_current_dir()}")
+        for row in self.text_file:
+            if "$ ls" in row:
+                self.reporter.trace("Listing the contents of: %s", self.current_obj.name)
 
-        elif "$ cd" in row:
-            self._change_cwd(row)
+            elif "$ cd" in row:
+                self._change_cwd(row)
 
-        else:
-            print(f"logging {row} as child of {self._get_current_dir()} --parent {self._get_current_parent()}")
-            obj = self.parse_line(row)
-            self.current_obj.child_objects.append(obj)
+            else:
+                if self.reporter.tracing:
+                    self.reporter.trace(
+                        "logging %s as child of %s --parent %s", row, self.current_obj.name, self._get_current_parent()
+                    )
+                obj = self.parse_line(row)
+                self.current_obj.child_objects.append(obj)
 
         self._get_size(self.root_object)
-        self.find_all_small_dirs()
-        self.find_smallest_size_to_fit_update()
 
-    def find_smallest_size_to_fit_update(self) -> None:
+    def find_smallest_size_to_fit_update(self) -> Tuple[str, int]:
         """Calculates what space is needed and what the smallest dir over that amount is"""
-        current_space = self.total_dir_size - self.root_object.dir_size
+        # The root directory contains everything, so it is always the largest
+        used_space = max(size for _, size in self.parsed)
+        current_space = self.total_dir_size - used_space
         space_required = self.update_size - current_space
 
-        sorted_list = sorted(self.dir_size_list, key=lambda i: i[1])
-        pprint(sorted_list)
-        print(f"Device has {current_space} and needs to clear {space_required}")
+        sorted_list = sorted(self.parsed, key=lambda i: i[1])
+        if self.reporter.tracing:
+            from pprint import pformat
+
+            self.reporter.trace(pformat(sorted_list))
+        self.reporter.info("Device has %s and needs to clear %s", current_space, space_required)
 
         dirs_over_x_size = [x for x in sorted_list if x[1] >= space_required]
-        print(f"Deleting {dirs_over_x_size[0][0]} would save {dirs_over_x_size[0][1]}")
+        self.reporter.info("Deleting %s would save %s", *dirs_over_x_size[0])
+        return dirs_over_x_size[0]
 
-    def find_all_small_dirs(self) -> None:
+    def find_all_small_dirs(self) -> int:
         """Loops through list of directories, summing their size if it is below the threshold"""
-        print(f"Locating all directories that are smaller than {self.max_dir_size}")
+        self.reporter.info("Locating all directories that are smaller than %s", self.max_dir_size)
         small_dirs_total = 0
-        for name, size in self.dir_size_list:
+        for name, size in self.parsed:
             if size <= self.max_dir_size:
                 small_dirs_total += size
 
-        print(small_dirs_total)
+        return small_dirs_total
 
     def _get_size(self, dir_obj: DirObj) -> int:
-        """Recursively sums the object sizes and assigns it the the total size attribute"""
-        total_size = dir_obj.size
-        for child_obj in dir_obj.child_objects:
-            total_size += child_obj.size
-            if child_obj.child_objects:
-                total_size += self._get_size(child_obj)
-
-        dir_obj.dir_size = total_size
-        if dir_obj.type == "dir":
-            self.dir_size_list.append((dir_obj.name, dir_obj.dir_size))
-
-        return total_size
+        """
+        Sums the object sizes of every directory below dir_obj and assigns them to their total size attributes
+
+        Notes
+        ------
+        Walks the tree with an explicit stack rather than recursing, so trees deeper than the recursion limit work.
+        Directories are still finished children first, in the order the recursive walk gave.
+        """
+        # Entries are (directory, whether its children have been sized yet)
+        stack = [(dir_obj, False)]
+        while stack:
+            current_obj, children_sized = stack.pop()
+            if not children_sized:
+                stack.append((current_obj, True))
+                stack.extend(
+                    (child_obj, False) for child_obj in reversed(current_obj.child_objects) if child_obj.child_objects
+                )
+                continue
+
+            total_size = current_obj.size
+            for child_obj in current_obj.child_objects:
+                total_size += child_obj.size
+                if child_obj.child_objects:
+                    total_size += child_obj.dir_size
+
+            current_obj.dir_size = total_size
+            if current_obj.type == "dir":
+                self.dir_size_list.append((current_obj.name, current_obj.dir_size))
+
+        return dir_obj.dir_size
 
     @staticmethod
     def _create_dir_obj(
         name: str, _type: str, size: int = 0, parent_object: DirObj = None, child_objects: List[DirObj] = None
     ):
         """Creates the pydantic objects representing the file structure"""
+        from _file_system import DirObj
+
         if child_objects is None:
             child_objects = []
 
@@ -135,29 +174,27 @@ class NoSpaceLeftOnDevice(AdventOfCode):
         new_dir = re.match(self.cd_patten, line).groups()[0]
         new_dir = new_dir.strip()
         if new_dir == "/":
-            print("Sitting at root")
-            self.current_obj = self.current_obj
+            self.reporter.trace("Sitting at root")
+            self.current_obj = self.root_object
 
         elif new_dir == "..":
-            print(f"Moving up from {self.current_obj.name} to {self.current_obj.parent_dir.name}")
+            self.reporter.trace("Moving up from %s to %s", self.current_obj.name, self.current_obj.parent_dir.name)
             self.current_obj = self.current_obj.parent_dir
 
         else:
-            print(f"Moving from {self.current_obj.name} to {new_dir}")
+            self.reporter.trace("Moving from %s to %s", self.current_obj.name, new_dir)
             try:
                 self.current_obj = [i for i in self.current_obj.child_objects if i.name == new_dir][0]
             except IndexError:
-                print([i.name for i in self.current_obj.child_objects])
+                import logging
+
+                logging.error([i.name for i in self.current_obj.child_objects])
                 raise
 
-        try:
+        self.cwd = self._get_current_dir()
+        if self.reporter.tracing:
             current_contents = self._extract_object_names(self.current_obj.child_objects)
-            self.cwd = self._get_current_dir()
-            print(f"Current {self.cwd} contents: {current_contents}")
-
-        except Exception as e:
-            print(e)
-            raise
+            self.reporter.trace("Current %s contents: %s", self.cwd, current_contents)
 
     @staticmethod
     def _extract_object_names(dir_objs: List[DirObj]) -> List[str]:
@@ -175,4 +212,4 @@ class NoSpaceLeftOnDevice(AdventOfCode):
 
 
 if __name__ == "__main__":
-    NoSpaceLeftOnDevice()
+    NoSpaceLeftOnDevice().main()
@@ -0,0 +1,21 @@
+"""Pydantic model of the file system, kept apart so pydantic is only imported once a file system is modelled"""
+from __future__ import annotations
+
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class DirObj(BaseModel):
+    """Class to hold details for objects in a file system"""
+
+    name: str = Field(..., description="Object name")
+    type: str = Field(..., description="Object type, either dir or file")
+    size: int = Field(0, description="The total size of this file. 0 if it is a directory")
+    parent_dir: Optional[DirObj] = Field(None, description="The parent of this object")
+    child_objects: Optional[List[DirObj]] = Field([], description="Child objects if this is a dir")
+
+    dir_size: Optional[int] = Field(0, description="The total size in this directory. 0 if it is a file")
+
+    class Config:
+        validate_assignment = True
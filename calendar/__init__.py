@@ -1 +1 @@
-from .core import AdventOfCode
+from .core import AdventOfCode, LineSource, ParseCache, PhaseMetrics, Reporter
@@ -1,19 +1,789 @@
-import logging
-from typing import Collection, Generator, List, TextIO
+import io
+import marshal
+import mmap
+import os
+import sys
+import time
+import zlib
+from contextlib import contextmanager
+from functools import cached_property, wraps
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Collection,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+AdventOfCodeType = TypeVar("AdventOfCodeType", bound="AdventOfCode")
+
+
+def _log_debug(message: str, *args) -> None:
+    """
+    Debug logging that never imports the logging module itself
+
+    Notes
+    ------
+    Debug messages only go anywhere once logging has been configured, which imports it. Until then, importing logging
+    just to drop the message would cost more start up time than most runs spend solving.
+    """
+    logging = sys.modules.get("logging")
+    if logging is not None:
+        logging.debug(message, *args)
+
+
+class LineSource:
+    """
+    Re-iterable, lazily read view over the lines of a file
+
+    Notes
+    ------
+    Every iteration opens the file with a buffered text reader and yields one line at a time, so only the current
+    block of the file is ever held in memory. Line endings are translated as in text mode, and the file is closed as
+    soon as the iteration finishes or the iterator is discarded.
+    """
+
+    def __init__(self, file_location: str, strip_rows: bool = True, encoding: str = "utf-8"):
+        self.file_location = file_location
+        self.strip_rows = strip_rows
+        self.encoding = encoding
+
+    def __iter__(self) -> Iterator[str]:
+        _log_debug("Streaming file: %s", self.file_location)
+        with open(self.file_location, encoding=self.encoding, newline=None) as raw_data:
+            yield from self.iter_text_lines(raw_data, self.strip_rows)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.file_location!r}, strip_rows={self.strip_rows})"
+
+    @staticmethod
+    def iter_text_lines(raw_data: TextIO, strip: bool = True) -> Iterator[str]:
+        """Steps through the lines of a text stream, stripped if strip is set"""
+        return map(str.strip, raw_data) if strip else iter(raw_data)
+
+    @staticmethod
+    def iter_buffer_lines(
+        buffer, strip: bool = True, encoding: str = "utf-8", start: int = 0, end: int = None
+    ) -> Generator[str, None, None]:
+        """
+        Steps through the lines of a bytes-like buffer between the start and end offsets
+
+        Notes
+        ------
+        Mirrors iterating over a file opened in text mode: unstripped lines keep a single "\\n" line ending. Each line
+        is found and decoded on its own, so whole files are far quicker to read through iter_text_lines, this is only
+        for byte ranges of a buffer.
+        """
+        end_of_buffer = len(buffer) if end is None else end
+        while start < end_of_buffer:
+            line_end = buffer.find(b"\n", start, end_of_buffer)
+            if line_end == -1:
+                line_end = end_of_buffer - 1
+
+            row = buffer[start : line_end + 1].decode(encoding)
+            start = line_end + 1
+
+            if strip:
+                yield row.strip()
+            elif row.endswith("\r\n"):
+                yield row[:-2] + "\n"
+            else:
+                yield row
+
+
+class BufferLineSource:
+    """Re-iterable view over the lines of an in-memory bytes buffer, decoded in blocks by a buffered text reader"""
+
+    def __init__(self, buffer: bytes, strip_rows: bool = True, encoding: str = "utf-8"):
+        self.buffer = buffer
+        self.strip_rows = strip_rows
+        self.encoding = encoding
+
+    def __iter__(self) -> Iterator[str]:
+        raw_data = io.TextIOWrapper(io.BytesIO(self.buffer), encoding=self.encoding, newline=None)
+        return LineSource.iter_text_lines(raw_data, self.strip_rows)
+
+
+class ParseCache:
+    """
+    On-disk store of parsed inputs, keyed by a hash of the input contents and the parser that produced them
+
+    Notes
+    ------
+    Entries are marshalled and zlib compressed when they are built only from plain built-in containers and scalars,
+    anything else is pickled. marshal quietly stores any buffer (array, mmap, numpy arrays) as plain bytes rather than
+    refusing it, so it cannot be trusted to reject what it would not round-trip.
+    Reading an entry refreshes its modification time, and once the directory grows past max_bytes the least recently
+    used entries are evicted first.
+    """
+
+    _MARSHAL = b"M"
+    _PICKLE = b"P"
+    _SUFFIX = ".parsed"
+    _MARSHAL_SCALARS = (type(None), bool, int, float, complex, str, bytes)
+    _MARSHAL_CONTAINERS = (tuple, list, set, frozenset)
+
+    def __init__(self, cache_dir: str = None, max_bytes: int = 256 * 1024 * 1024):
+        if cache_dir is None:
+            cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "adventofcode2022")
+
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    @classmethod
+    def from_env(cls) -> Optional["ParseCache"]:
+        """
+        Builds a cache from the AOC_PARSE_CACHE env var, None if it is unset
+
+        Set it to "1" to use the default directory, or to a path to cache somewhere else.
+        """
+        setting = os.environ.get("AOC_PARSE_CACHE", "0")
+        if setting in ("", "0"):
+            return None
+
+        if setting == "1":
+            return cls()
+
+        return cls(setting)
+
+    @staticmethod
+    def key(parser_name: str, parser_version: int, input_digest: str) -> str:
+        """Combines the parser identity and the input hash into a single cache key"""
+        import hashlib
+
+        return hashlib.sha256(f"{parser_name}:{parser_version}:{input_digest}".encode()).hexdigest()
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Returns (True, value) for a cached entry, or (False, None) on a miss"""
+        entry_location = self._entry_location(key)
+        try:
+            with open(entry_location, "rb") as entry:
+                payload = entry.read()
+
+        except FileNotFoundError:
+            _log_debug("Parse cache miss: %s", key)
+            return False, None
+
+        try:
+            value = self._decode(payload)
+
+        except Exception as e:
+            import logging
+
+            logging.warning(f"Discarding unreadable parse cache entry: {entry_location} ({e})")
+            os.remove(entry_location)
+            return False, None
+
+        os.utime(entry_location)
+        _log_debug("Parse cache hit: %s", key)
+        return True, value
+
+    def put(self, key: str, value: Any) -> None:
+        """Writes an entry, then evicts the least recently used entries if the cache is over its size cap"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        entry_location = self._entry_location(key)
+        temp_location = f"{entry_location}.{os.getpid()}.tmp"
+        with open(temp_location, "wb") as entry:
+            entry.write(self._encode(value))
+
+        os.replace(temp_location, entry_location)
+        self._evict()
+
+    def _entry_location(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + self._SUFFIX)
+
+    def _encode(self, value: Any) -> bytes:
+        """
+        Serialises with marshal where it round-trips, it is faster and more compact than pickle for plain data
+
+        >>> from array import array
+        >>> cache = ParseCache()
+        >>> cache._decode(cache._encode((array("q", [1, 2, 3]), [1, "a"])))
+        (array('q', [1, 2, 3]), [1, 'a'])
+        """
+        if self._marshal_safe(value):
+            fmt, payload = self._MARSHAL + bytes([marshal.version]), marshal.dumps(value)
+
+        else:
+            import pickle
+
+            fmt, payload = self._PICKLE + bytes([pickle.HIGHEST_PROTOCOL]), pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+        return fmt + zlib.compress(payload, 1)
+
+    @classmethod
+    def _marshal_safe(cls, value: Any) -> bool:
+        """Whether value is built only from the exact built-in types marshal gives back unchanged"""
+        pending = [value]
+        while pending:
+            item = pending.pop()
+            item_type = type(item)
+            if item_type in cls._MARSHAL_SCALARS:
+                continue
+
+            if item_type in cls._MARSHAL_CONTAINERS:
+                pending.extend(item)
+
+            elif item_type is dict:
+                pending.extend(item.keys())
+                pending.extend(item.values())
+
+            else:
+                return False
+
+        return True
+
+    def _decode(self, data: bytes) -> Any:
+        fmt, version, payload = data[:1], data[1], zlib.decompress(data[2:])
+        if fmt == self._MARSHAL and version == marshal.version:
+            return marshal.loads(payload)
+
+        if fmt == self._PICKLE:
+            import pickle
+
+            return pickle.loads(payload)
+
+        raise ValueError(f"Unknown parse cache format: {fmt!r} v{version}")
+
+    def _evict(self) -> None:
+        """Removes the least recently used entries until the cache fits within max_bytes"""
+        entries = []
+        total_size = 0
+        with os.scandir(self.cache_dir) as scanner:
+            for dir_entry in scanner:
+                if dir_entry.name.endswith(self._SUFFIX):
+                    stat = dir_entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, dir_entry.path))
+                    total_size += stat.st_size
+
+        entries.sort()
+        for _, size, entry_location in entries:
+            if total_size <= self.max_bytes:
+                break
+
+            _log_debug("Evicting parse cache entry: %s", entry_location)
+            os.remove(entry_location)
+            total_size -= size
+
+
+class PhaseMetrics:
+    """
+    Records how long each phase of a run takes, optionally profiling it with cProfile and/or tracemalloc
+
+    Notes
+    ------
+    Phases can nest, eg main() calling solve_part1(). Every figure is exclusive of the phases nested inside it, so the
+    phase timings add up to the whole run. Profilers are chosen with the AOC_PROFILE env var, a comma separated list
+    of "cprofile" and "tracemalloc".
+    """
+
+    PROFILERS = ("cprofile", "tracemalloc")
+
+    def __init__(self, profilers: Iterable[str] = ()):
+        self.profilers = set(profilers)
+        unknown_profilers = self.profilers.difference(self.PROFILERS)
+        if unknown_profilers:
+            raise ValueError(f"Unknown profilers: {sorted(unknown_profilers)}, expected some of {self.PROFILERS}")
+
+        self.phases: Dict[str, Dict[str, Any]] = {}
+        self._profiles: Dict[str, list] = {}
+        self._active: List[dict] = []
+
+    @classmethod
+    def from_env(cls) -> "PhaseMetrics":
+        """Builds the metrics with the profilers listed in the AOC_PROFILE env var"""
+        setting = os.environ.get("AOC_PROFILE", "")
+        return cls(profiler.strip().lower() for profiler in setting.split(",") if profiler.strip())
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Times the enclosed block as the named phase, adding to any earlier time spent in the same phase"""
+        outer = self._active[-1] if self._active else None
+        if outer is not None:
+            self._pause(outer)
+
+        frame = {"name": name, "child_seconds": 0.0, "peak_bytes": 0, "profiler": None}
+        self._active.append(frame)
+        self._resume(frame)
+        start = time.perf_counter()
+        try:
+            yield
+
+        finally:
+            elapsed = time.perf_counter() - start
+            self._pause(frame)
+            self._active.pop()
+            self._record(frame, elapsed - frame["child_seconds"])
+
+            if outer is not None:
+                outer["child_seconds"] += elapsed
+                self._resume(outer)
+
+    @property
+    def running(self) -> bool:
+        """Whether any phase is currently being timed"""
+        return bool(self._active)
+
+    def to_dict(self, top_functions: int = 10) -> Dict[str, Any]:
+        """JSON friendly view of the metrics, including the most expensive functions per phase when profiled"""
+        phases = {name: dict(phase) for name, phase in self.phases.items()}
+        if "cprofile" in self.profilers:
+            import pstats
+
+            for name, profilers in self._profiles.items():
+                stats = pstats.Stats(*profilers)
+                stats.sort_stats(pstats.SortKey.CUMULATIVE)
+                phases[name]["top_functions"] = [
+                    {
+                        "function": f"{file_name}:{line_number}({function_name})",
+                        "calls": total_calls,
+                        "cumulative_seconds": cumulative_seconds,
+                    }
+                    for (file_name, line_number, function_name), (_, total_calls, _, cumulative_seconds, _) in [
+                        (func, stats.stats[func]) for func in stats.fcn_list[:top_functions]
+                    ]
+                ]
+
+        return {
+            "profilers": sorted(self.profilers),
+            "total_seconds": sum(phase["seconds"] for phase in self.phases.values()),
+            "phases": phases,
+        }
+
+    def export(self, file_location: str, **details) -> None:
+        """Writes the metrics, plus any extra details about the run, to a JSON file"""
+        import json
+
+        with open(file_location, "w") as metrics_file:
+            json.dump({**details, **self.to_dict()}, metrics_file, indent=2, default=str)
+
+    def dump_profiles(self, directory: str) -> List[str]:
+        """Writes each phase's cProfile stats to <phase>.prof in the directory, returning the files written"""
+        import pstats
+
+        os.makedirs(directory, exist_ok=True)
+        file_locations = []
+        for name, profilers in self._profiles.items():
+            file_location = os.path.join(directory, f"{name}.prof")
+            pstats.Stats(*profilers).dump_stats(file_location)
+            file_locations.append(file_location)
+
+        return file_locations
+
+    def _pause(self, frame: dict) -> None:
+        if frame["profiler"] is not None:
+            frame["profiler"].disable()
+
+        if "tracemalloc" in self.profilers:
+            import tracemalloc
+
+            frame["peak_bytes"] = max(frame["peak_bytes"], tracemalloc.get_traced_memory()[1])
+
+    def _resume(self, frame: dict) -> None:
+        if "tracemalloc" in self.profilers:
+            import tracemalloc
+
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+
+            tracemalloc.reset_peak()
+
+        if "cprofile" in self.profilers:
+            if frame["profiler"] is None:
+                import cProfile
+
+                frame["profiler"] = cProfile.Profile()
+
+            frame["profiler"].enable()
+
+    def _record(self, frame: dict, seconds: float) -> None:
+        phase = self.phases.setdefault(frame["name"], {"seconds": 0.0, "calls": 0})
+        phase["seconds"] += seconds
+        phase["calls"] += 1
+        if "tracemalloc" in self.profilers:
+            phase["peak_bytes"] = max(phase.get("peak_bytes", 0), frame["peak_bytes"])
+
+        if frame["profiler"] is not None:
+            self._profiles.setdefault(frame["name"], []).append(frame["profiler"])
+
+
+class Reporter:
+    """
+    Buffered, level controlled output for a solver
+
+    Notes
+    ------
+    There are three levels: RESULT for the final answers, INFO for supporting detail and TRACE for per-row messages.
+    Only RESULT is shown by default, AOC_REPORT_LEVEL=info/trace shows more. Messages are %-style templates that are
+    only formatted when their level is enabled, and hot loops should check tracing once up front so disabled trace
+    calls cost nothing at all. Output is written in large blocks rather than a line at a time.
+    """
+
+    RESULT = 0
+    INFO = 1
+    TRACE = 2
+
+    LEVEL_NAMES = {"result": RESULT, "info": INFO, "trace": TRACE}
+
+    def __init__(self, level: int = RESULT, stream: TextIO = None, buffer_size: int = 64 * 1024):
+        self.level = level
+        self.stream = stream
+        self.buffer_size = buffer_size
+        self._buffer: List[str] = []
+        self._buffered_chars = 0
+
+    @classmethod
+    def from_env(cls) -> "Reporter":
+        """Builds a reporter at the level named by the AOC_REPORT_LEVEL env var, defaulting to results only"""
+        setting = os.environ.get("AOC_REPORT_LEVEL", "result").strip().lower()
+        if setting not in cls.LEVEL_NAMES:
+            raise ValueError(f"Unknown AOC_REPORT_LEVEL: {setting}, expected one of {list(cls.LEVEL_NAMES)}")
+
+        return cls(cls.LEVEL_NAMES[setting])
+
+    @property
+    def tracing(self) -> bool:
+        """Whether per-row TRACE messages are being kept"""
+        return self.level >= self.TRACE
+
+    def enabled(self, level: int) -> bool:
+        """Whether messages at the level are being kept"""
+        return self.level >= level
+
+    def result(self, message: str, *args) -> None:
+        """Reports a final answer"""
+        self._emit(self.RESULT, message, args)
+
+    def info(self, message: str, *args) -> None:
+        """Reports supporting detail about an answer"""
+        self._emit(self.INFO, message, args)
+
+    def trace(self, message: str, *args) -> None:
+        """Reports per-row detail, only useful for debugging"""
+        self._emit(self.TRACE, message, args)
+
+    def flush(self) -> None:
+        """Writes out everything buffered so far"""
+        if self._buffer:
+            stream = self.stream if self.stream is not None else sys.stdout
+            stream.write("\n".join(self._buffer) + "\n")
+            stream.flush()
+            self._buffer.clear()
+            self._buffered_chars = 0
+
+    def _emit(self, level: int, message: str, args: tuple) -> None:
+        if level > self.level:
+            return
+
+        text = message % args if args else message
+        self._buffer.append(text)
+        self._buffered_chars += len(text) + 1
+        if self._buffered_chars >= self.buffer_size:
+            self.flush()
+
+
+def timed_phase(phase_name: str, parse_first: bool = False, end_of_run: bool = False) -> Callable:
+    """
+    Decorator running an AdventOfCode method as a phase of its metrics
+
+    With parse_first the input is parsed before the clock starts, so parsing is always reported as its own phase.
+    With end_of_run, once the outermost phase has finished the reporter is flushed and the metrics are written to
+    AOC_METRICS_FILE if it is set.
+    """
+
+    def decorator(method: Callable) -> Callable:
+        if getattr(method, "phase_name", None) is not None:
+            return method
+
+        @wraps(method)
+        def wrapper(self: "AdventOfCode", *args, **kwargs) -> Any:
+            if parse_first:
+                self.parsed
+
+            try:
+                with self.metrics.phase(phase_name):
+                    return method(self, *args, **kwargs)
+
+            finally:
+                if end_of_run and not self.metrics.running:
+                    self.reporter.flush()
+                    metrics_file_location = os.environ.get("AOC_METRICS_FILE")
+                    if metrics_file_location:
+                        self.metrics.export(
+                            metrics_file_location, solver=type(self).__qualname__, input=self.input_file_location
+                        )
+
+        wrapper.phase_name = phase_name
+        return wrapper
+
+    return decorator
 
 
 class AdventOfCode:
-    """Base class that loads up the input data"""
+    """
+    Base class that loads up the input data
+
+    Notes
+    ------
+    Constructing a solver has no side effects beyond loading the input. Each day overrides parse() to build its
+    working structure and solve_part1()/solve_part2() to return the answers; main() reports them through
+    self.reporter, which is flushed once main() finishes.
+
+    Days that have more than one way of solving list them in engines, the first being the default. The engine is
+    picked with AOC_ENGINE (or by setting self.engine), and a day without the requested engine quietly keeps its
+    default, so one setting can be applied across every day. An engine's optional dependencies (eg numpy) live in the
+    day's private _vectorized_*.py module, imported only once that engine has been picked, so they are never needed
+    or loaded by the default engine. Engines listed in raw_engines parse the raw input bytes themselves, so while one
+    of them is picked a file's rows are streamed as a LineSource rather than loaded, and only read if the day has to
+    fall back to them.
+
+    When a ParseCache is attached (see AOC_PARSE_CACHE) the result of parse() is stored on disk, keyed by the input
+    contents and parser_version, so bump parser_version whenever a day changes the shape of what parse() returns.
+
+    Every solver records its load, parse, part1, part2 and report (main) phases in self.metrics, subclasses get this
+    automatically for any of those methods they override. Set AOC_PROFILE to add cProfile/tracemalloc figures and
+    AOC_METRICS_FILE to have main() export them as JSON.
+    """
+
+    _PHASE_METHODS = {"solve_part1": "part1", "solve_part2": "part2"}
+
+    input_file_location: str = "./input.txt"
+    strip_rows: bool = True
+    parser_version: int = 1
+    engines: Tuple[str, ...] = ("python",)
+    raw_engines: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for method_name, phase_name in cls._PHASE_METHODS.items():
+            if method_name in cls.__dict__:
+                setattr(cls, method_name, timed_phase(phase_name, parse_first=True)(cls.__dict__[method_name]))
+
+        if "main" in cls.__dict__:
+            cls.main = timed_phase("report", end_of_run=True)(cls.__dict__["main"])
+
+    def __init__(self, text_file: Iterable[str] = None, lazy: bool = None):
+        self._input_from_file = text_file is None
+        self._input_buffer: Optional[bytes] = None
+        self.parse_cache: Optional[ParseCache] = ParseCache.from_env()
+        self.metrics = PhaseMetrics.from_env()
+        self.reporter = Reporter.from_env()
+        self.engine = self._select_engine()
+
+        if text_file is None:
+            with self.metrics.phase("load"):
+                text_file = self._load_rows(self.input_file_location, lazy)
+
+        self.text_file: Iterable[str] = text_file
+
+    @classmethod
+    def from_path(cls: Type[AdventOfCodeType], file_location: str, lazy: bool = None) -> AdventOfCodeType:
+        """Creates a solver reading its rows from the file at the given location"""
+        metrics = PhaseMetrics.from_env()
+        with metrics.phase("load"):
+            obj = cls(cls._load_rows(file_location, lazy))
+
+        obj.metrics = metrics
+        obj.input_file_location = file_location
+        obj._input_from_file = True
+        return obj
+
+    @classmethod
+    def from_text(cls: Type[AdventOfCodeType], text: str) -> AdventOfCodeType:
+        """Creates a solver from an in-memory string holding the whole puzzle input"""
+        metrics = PhaseMetrics.from_env()
+        with metrics.phase("load"):
+            obj = cls(cls._data_to_list(io.StringIO(text), cls.strip_rows))
+
+        obj.metrics = metrics
+        obj._input_buffer = text.encode()
+        return obj
+
+    @classmethod
+    def from_bytes(cls: Type[AdventOfCodeType], data: bytes, lazy: bool = None) -> AdventOfCodeType:
+        """Creates a solver from an in-memory bytes buffer holding the whole puzzle input"""
+        metrics = PhaseMetrics.from_env()
+        with metrics.phase("load"):
+            if cls._lazy_input(lazy):
+                obj = cls(BufferLineSource(data, cls.strip_rows))
+            else:
+                obj = cls(list(BufferLineSource(data, cls.strip_rows)))
+
+        obj.metrics = metrics
+        obj._input_buffer = data
+        return obj
+
+    def parse(self) -> Any:
+        """Converts the input rows into the structure the solvers work from"""
+        return self.text_file
+
+    @cached_property
+    def parsed(self) -> Any:
+        """The parsed input, built on first use and shared by both parts"""
+        with self.metrics.phase("parse"):
+            cache_key = self._parse_cache_key()
+            if cache_key is not None:
+                hit, parsed = self.parse_cache.get(cache_key)
+                if hit:
+                    return parsed
+
+            parsed = self.parse()
+            if cache_key is not None:
+                self.parse_cache.put(cache_key, parsed)
+
+            return parsed
+
+    @cached_property
+    def input_digest(self) -> Optional[str]:
+        """SHA-256 of the raw input, None if the rows were handed over directly and the source is unknown"""
+        import hashlib
+
+        if self._input_buffer is not None:
+            return hashlib.sha256(self._input_buffer).hexdigest()
+
+        if self._input_from_file:
+            # Hashed a block at a time so big inputs are never read into memory whole
+            digest = hashlib.sha256()
+            with open(self.input_file_location, "rb") as raw_data:
+                for block in iter(lambda: raw_data.read(1024 * 1024), b""):
+                    digest.update(block)
+
+            return digest.hexdigest()
+
+        return None
+
+    @contextmanager
+    def raw_input(self) -> Iterator[Optional[Union[bytes, mmap.mmap]]]:
+        """
+        The undecoded input, for solvers that work on the bytes directly
+
+        Notes
+        ------
+        Yields the in-memory buffer, or the input file mapped read-only, None if the rows were handed over directly.
+        A mapped file is closed on exit, so nothing viewing it may outlive the with block, see map_file.
+        """
+        if self._input_buffer is not None:
+            yield self._input_buffer
+
+        elif self._input_from_file:
+            with open(self.input_file_location, "rb") as raw_data:
+                if os.fstat(raw_data.fileno()).st_size == 0:
+                    yield b""
+                    return
+
+                with self.map_file(raw_data) as buffer:
+                    yield buffer
+
+        else:
+            yield None
+
+    @staticmethod
+    @contextmanager
+    def map_file(raw_data: BinaryIO) -> Iterator[mmap.mmap]:
+        """
+        Maps an open, non-empty file read-only, closing the map on exit
 
-    def __init__(self, strip_rows: bool = True):
-        self.input_file_location = "./input.txt"
-        raw_data = self._open_file()
-        self.text_file: List[str] = self._data_to_list(raw_data, strip_rows)
+        Notes
+        ------
+        If an error is raised inside the block its traceback may still hold views of the map, which would make closing
+        it raise BufferError and hide the real error. The map is then left for the garbage collector to close once
+        those views go.
+        """
+        buffer = mmap.mmap(raw_data.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield buffer
+
+        except BaseException:
+            try:
+                buffer.close()
+
+            except BufferError:
+                pass
+
+            raise
+
+        buffer.close()
+
+    def solve_part1(self) -> Any:
+        """Returns the answer to the first part of the day"""
+        raise NotImplementedError
+
+    def solve_part2(self) -> Any:
+        """Returns the answer to the second part of the day"""
+        raise NotImplementedError
+
+    def solve(self) -> Tuple[Any, Any]:
+        """Returns the answers to both parts"""
+        return self.solve_part1(), self.solve_part2()
+
+    @timed_phase("report", end_of_run=True)
+    def main(self) -> None:
+        """Main function, solves both parts and reports the answers"""
+        self.reporter.result("Task 1: %s", self.solve_part1())
+        self.reporter.result("Task 2: %s", self.solve_part2())
+
+    def _parse_cache_key(self) -> Optional[str]:
+        """The cache key for this input, None if caching is off or there is nothing worth caching"""
+        if self.parse_cache is None or type(self).parse is AdventOfCode.parse:
+            return None
+
+        input_digest = self.input_digest
+        if input_digest is None:
+            return None
+
+        return self.parse_cache.key(type(self).__qualname__, self.parser_version, input_digest)
 
-    def _open_file(self) -> TextIO:
+    @classmethod
+    def _select_engine(cls, engine: str = None) -> str:
+        """Resolves which engine to solve with, falling back to the AOC_ENGINE env var and then the day's default"""
+        if engine is None:
+            engine = os.environ.get("AOC_ENGINE", "")
+
+        if engine in cls.engines:
+            return engine
+
+        if engine:
+            _log_debug("%s has no %s engine, using %s", cls.__qualname__, engine, cls.engines[0])
+
+        return cls.engines[0]
+
+    @staticmethod
+    def _lazy_input(lazy: bool = None) -> bool:
+        """Resolves whether to stream the input, falling back to the AOC_LAZY_INPUT env var"""
+        if lazy is None:
+            lazy = os.environ.get("AOC_LAZY_INPUT", "0") not in ("", "0")
+
+        return lazy
+
+    @classmethod
+    def _load_rows(cls, file_location: str, lazy: bool = None) -> Iterable[str]:
+        """Reads the rows of the input file, either all at once or as a streaming LineSource"""
+        if cls._lazy_input(lazy) or cls._reads_raw_input(file_location):
+            return LineSource(file_location, cls.strip_rows)
+
+        with cls._open_file(file_location) as raw_data:
+            return cls._data_to_list(raw_data, cls.strip_rows)
+
+    @classmethod
+    def _reads_raw_input(cls, file_location: str) -> bool:
+        """Whether parse() will work from the file's raw bytes, so loading its rows up front would be wasted"""
+        return cls._select_engine() in cls.raw_engines
+
+    @staticmethod
+    def _open_file(file_location: str) -> TextIO:
         """Opens the file into memory"""
-        logging.debug(f"Opening file: {self.input_file_location}")
-        raw_data = open(self.input_file_location)
+        _log_debug("Opening file: %s", file_location)
+        raw_data = open(file_location)
 
         return raw_data
 
@@ -40,8 +810,100 @@ class AdventOfCode:
 
         Otherwise, will step forward by 1 position each time.
         Eg "abcdefghi" with size 3 would become "abc", "bcd", "cde" etc
+
+        Bytes-like sequences (bytes, bytearray, mmap, memoryview) are stepped through as memoryview slices, so no chunk
+        is copied. Chunks are generated one at a time, so stopping early never builds the rest.
+        """
+        if isinstance(seq, (bytes, bytearray, memoryview, mmap.mmap)):
+            seq = memoryview(seq)
+
+        step = size if distinct_groups else 1
+        return (seq[pos : pos + size] for pos in range(0, len(seq), step))
+
+    @staticmethod
+    def line_blocks(
+        buffer, block_size: int = 16 * 1024 * 1024, start: int = 0, end: int = None
+    ) -> Generator[memoryview, None, None]:
+        """
+        Steps through a bytes-like buffer in memoryview blocks of roughly block_size, each ending after a line break
+
+        Notes
+        ------
+        Lets vectorised engines work through inputs far bigger than memory one block at a time without ever splitting
+        a line. Only the last block can end without a line break, and a line longer than block_size gets a block of
+        its own. The buffer needs find/rfind, so bytes, bytearray or mmap.
+        """
+        view = memoryview(buffer)
+        end_of_buffer = len(buffer) if end is None else end
+        try:
+            while start < end_of_buffer:
+                block_end = min(start + block_size, end_of_buffer)
+                if block_end < end_of_buffer:
+                    line_break = buffer.rfind(b"\n", start, block_end)
+                    if line_break == -1:
+                        line_break = buffer.find(b"\n", block_end, end_of_buffer)
+
+                    block_end = end_of_buffer if line_break == -1 else line_break + 1
+
+                yield view[start:block_end]
+                start = block_end
+
+        finally:
+            # A block still viewed by an error's traceback keeps the view exported, it is released when that goes
+            try:
+                view.release()
+
+            except BufferError:
+                pass
+
+    @staticmethod
+    def line_bounds(raw) -> Tuple[Any, Any]:
+        """
+        Where every line of a block starts and ends, for a uint8 numpy array of the block's bytes
+
+        Notes
+        ------
+        The ends are exclusive and stop before the line break, and before the \r of a Windows line ending, so
+        ends - starts is the length of each line's content. Only the last line may be missing its line break.
         """
-        if distinct_groups:
-            return (seq[pos : pos + size] for pos in range(0, len(seq), size))
+        import numpy as np
+
+        newline, carriage_return = ord("\n"), ord("\r")
+        line_ends = np.flatnonzero(raw == newline)
+        line_starts = np.concatenate(([0], line_ends + 1))
+        if len(raw) and raw[-1] == newline:
+            line_starts = line_starts[:-1]
         else:
-            return (seq[pos : pos + size] for pos in range(0, len(seq)))
+            line_ends = np.concatenate((line_ends, [len(raw)]))
+
+        has_carriage_return = raw[np.maximum(line_ends - 1, 0)] == carriage_return
+        line_ends = line_ends - (has_carriage_return & (line_ends > line_starts))
+        return line_starts, line_ends
+
+    @staticmethod
+    def stream_chunker(
+        stream: BinaryIO, size: int, distinct_groups: bool = True, block_size: int = 1024 * 1024
+    ) -> Generator[memoryview, None, None]:
+        """
+        Same chunks as chunker, but read from a binary stream block by block so the input never has to fit in memory
+
+        Notes
+        ------
+        Chunks are memoryview slices of the block currently being read, only the few bytes a window spans across block
+        boundaries are copied forward. Like chunker, the final chunks may be shorter than size.
+        """
+        step = size if distinct_groups else 1
+        block_size = max(block_size, size)
+        carry = b""
+        while True:
+            block = stream.read(block_size)
+            buffer = memoryview(carry + block if carry else block)
+            if not block:
+                yield from (buffer[pos : pos + size] for pos in range(0, len(buffer), step))
+                return
+
+            num_full_chunks = (len(buffer) - size) // step + 1 if len(buffer) >= size else 0
+            for pos in range(0, num_full_chunks * step, step):
+                yield buffer[pos : pos + size]
+
+            carry = buffer[num_full_chunks * step :].tobytes()
@@ -0,0 +1,183 @@
+"""
+Runs any selection of days, parts and inputs from one entry point, spread over a pool of worker processes
+
+Usage (from the repo root, with the repo root on PYTHONPATH):
+    python -m calendar                                  # every day, both parts, each day's own input.txt
+    python -m calendar --days 1 4 --parts 2 --jobs 4
+    python -m calendar --days 5 --input 5=big_moves.txt --input 5=other_moves.txt
+"""
+import importlib.util
+import os
+import sys
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple, Type
+
+from .core import AdventOfCode
+
+CALENDAR_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class DayJob(NamedTuple):
+    """One day run against one input file"""
+
+    day: int
+    input_location: str
+    parts: Tuple[int, ...]
+    lazy: Optional[bool] = None
+    engine: Optional[str] = None
+
+
+def discover_days() -> Dict[int, str]:
+    """Finds each day's solver module, the first public .py file in every numbered directory of the calendar"""
+    day_modules = {}
+    for dir_name in os.listdir(CALENDAR_DIR):
+        day_dir = os.path.join(CALENDAR_DIR, dir_name)
+        if not dir_name.isdigit() or not os.path.isdir(day_dir):
+            continue
+
+        module_files = sorted(f for f in os.listdir(day_dir) if f.endswith(".py") and not f.startswith("_"))
+        if module_files:
+            day_modules[int(dir_name)] = os.path.join(day_dir, module_files[0])
+
+    return dict(sorted(day_modules.items()))
+
+
+def load_day(day: int) -> Type[AdventOfCode]:
+    """Imports a day's module by path and returns the AdventOfCode subclass it defines"""
+    module_location = discover_days()[day]
+    module_name = f"aoc_day_{day}"
+    if module_name not in sys.modules:
+        # Days import their private helper modules (eg day 2's _moves) relative to their own directory
+        day_dir = os.path.dirname(module_location)
+        if day_dir not in sys.path:
+            sys.path.insert(0, day_dir)
+
+        spec = importlib.util.spec_from_file_location(module_name, module_location)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+
+    module = sys.modules[module_name]
+    for obj in vars(module).values():
+        if isinstance(obj, type) and issubclass(obj, AdventOfCode) and obj.__module__ == module_name:
+            return obj
+
+    raise LookupError(f"No AdventOfCode solver found in {module_location}")
+
+
+def run_job(job: DayJob) -> dict:
+    """Solves the requested parts of one day for one input, timing the whole run and collecting the solver's metrics"""
+    start = time.perf_counter()
+    result = {"day": job.day, "input": job.input_location, "answers": {}, "error": None, "metrics": None}
+    try:
+        solver = load_day(job.day).from_path(job.input_location, lazy=job.lazy)
+        if job.engine is not None:
+            solver.engine = solver._select_engine(job.engine)
+
+        for part in job.parts:
+            result["answers"][part] = getattr(solver, f"solve_part{part}")()
+
+        result["metrics"] = solver.metrics.to_dict()
+
+    except Exception as e:
+        result["error"] = f"{e.__class__.__name__}: {e}"
+
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def build_jobs(
+    days: List[int], parts: List[int], inputs: List[str], lazy: Optional[bool] = None, engine: Optional[str] = None
+) -> Tuple[List[DayJob], List[str]]:
+    """Expands the command line selection into one job per (day, input) pair, returning any problems found"""
+    available_days = discover_days()
+    problems = [f"Day {day} not found" for day in days if day not in available_days]
+
+    day_inputs: Dict[int, List[str]] = {}
+    for entry in inputs:
+        day, sep, input_location = entry.partition("=")
+        if not sep or not day.isdigit():
+            problems.append(f"Inputs must look like DAY=PATH, got: {entry}")
+            continue
+
+        day_inputs.setdefault(int(day), []).append(os.path.abspath(input_location))
+
+    selected_days = days or available_days
+    for day in sorted(day_inputs):
+        if day not in available_days:
+            problems.append(f"Input given for day {day}, which was not found")
+
+        elif day not in selected_days:
+            problems.append(f"Input given for day {day}, which is not one of the selected days")
+
+    jobs = []
+    for day in selected_days:
+        if day not in available_days:
+            continue
+
+        default_input = os.path.join(os.path.dirname(available_days[day]), "input.txt")
+        for input_location in day_inputs.get(day, [default_input]):
+            jobs.append(DayJob(day, input_location, tuple(parts), lazy, engine))
+
+    return jobs, problems
+
+
+def run_jobs(jobs: List[DayJob], num_workers: int = None) -> List[dict]:
+    """Runs the jobs across a process pool, or in this process when a single worker is asked for"""
+    if num_workers == 1 or len(jobs) <= 1:
+        return [run_job(job) for job in jobs]
+
+    # Only imported once a pool is needed, it pulls in multiprocessing and threading
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        return list(executor.map(run_job, jobs))
+
+
+def _format_result(result: dict) -> str:
+    input_name = os.path.relpath(result["input"])
+    if result["error"] is not None:
+        outcome = f"ERROR {result['error']}"
+    else:
+        outcome = " | ".join(f"part {part}: {answer}" for part, answer in result["answers"].items())
+
+    return f"Day {result['day']:>2} | {input_name} | {outcome} | {result['seconds']:.3f}s"
+
+
+def main(argv: List[str] = None) -> int:
+    """Command line entry point, returns the process exit code"""
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(prog="python -m calendar", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--days", type=int, nargs="+", default=[], help="Days to run, defaults to every day")
+    parser.add_argument("--parts", type=int, nargs="+", choices=[1, 2], default=[1, 2], help="Parts to solve")
+    parser.add_argument(
+        "--input",
+        dest="inputs",
+        action="append",
+        default=[],
+        metavar="DAY=PATH",
+        help="Input file for a day, repeat to run a day over several inputs. Defaults to the day's input.txt",
+    )
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes, defaults to the number of cores")
+    parser.add_argument("--lazy", action="store_true", default=None, help="Stream inputs instead of loading them")
+    parser.add_argument("--engine", help="Engine to solve with where a day has it, eg numpy. Defaults to AOC_ENGINE")
+    parser.add_argument("--json", action="store_true", help="Print one JSON object per result instead of a table")
+    args = parser.parse_args(argv)
+
+    jobs, problems = build_jobs(args.days, args.parts, args.inputs, args.lazy, args.engine)
+    if problems:
+        parser.error("; ".join(problems))
+
+    start = time.perf_counter()
+    results = run_jobs(jobs, args.jobs)
+    wall_time = time.perf_counter() - start
+
+    for result in results:
+        print(json.dumps(result, default=str) if args.json else _format_result(result))
+
+    if not args.json:
+        print(f"Ran {len(results)} job(s) in {wall_time:.3f}s")
+
+    return 1 if any(result["error"] is not None for result in results) else 0